@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""_pipeline_cache.py - On-disk cache of generated C code
+
+Memoizes the parse → IR → C pipeline for the test and debug scripts,
+keyed by the SHA-256 of the DarijaLang source and of the compiler's own
+sources, so an edit to either invalidates the entry.
+"""
+
+import contextlib
+import functools
+import hashlib
+import os
+
+from darija_parser import parse
+from darija_ir import generate_ir
+from darija_c_emitter import CEmitter
+from darija_cache import cache_dir
+
+# Compiler modules whose sources determine the generated C
+_COMPILER_SOURCES = (
+    "darija_lexer.py", "darija_parser.py", "darija_fold.py", "darija_ir.py", "darija_c_emitter.py",
+)
+
+@functools.lru_cache(maxsize=1)
+def _compiler_digest() -> bytes:
+    """Digest of the compiler sources, computed once per process."""
+    digest = hashlib.sha256()
+    root = os.path.dirname(os.path.abspath(__file__))
+    for name in _COMPILER_SOURCES:
+        with open(os.path.join(root, name), "rb") as f:
+            digest.update(f.read())
+    return digest.digest()
+
+def _cached_c_path(src: str) -> str:
+    digest = hashlib.sha256(_compiler_digest())
+    digest.update(src.encode("utf-8"))
+    return os.path.join(cache_dir(), f"{digest.hexdigest()}.c")
+
+def compile_cached(src: str) -> str:
+    """Return the C code generated for *src*, from the cache when possible.
+
+    On a miss the full pipeline runs and the result is written atomically
+    (temp file + rename); a cache that cannot be written is skipped.
+    """
+    path = _cached_c_path(src)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        pass
+
+    c_code = CEmitter().emit(generate_ir(parse(src)))
+
+    pending = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(pending, "w", encoding="utf-8") as f:
+            f.write(c_code)
+        os.replace(pending, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(pending)
+    return c_code
@@ -0,0 +1,24 @@
+# darija_c_emitter.pxd - static declarations for the optional compiled build
+#
+# Cython reads this file alongside darija_c_emitter.py (see setup.py) and
+# turns CEmitter into a cdef class with typed attributes. The .py module is
+# unchanged and still runs as plain Python when no extension is built.
+
+cdef class CEmitter:
+    cdef public set c_keywords
+    cdef public set used_identifiers
+    cdef int _jmp_counter
+    cdef dict _safe_cache
+    cdef dict _operand_cache
+    cdef dict _dispatch
+    cdef object _text
+    cdef object _out
+    cdef object _buf
+    cdef dict _seen
+    cdef int _indent
+    cdef str _indent_str
+
+    cpdef str safe_identifier(self, str name)
+    cpdef _emit_function(self, func)
+    cpdef _emit_instruction(self, instr)
+    cpdef str _format_operand(self, operand)
@@ -4,17 +4,59 @@
 Converts DarijaLang IR to C source code for compilation by gcc/clang.
 """
 
+import contextlib
+import hashlib
+import io
 import os
+import shutil
 import tempfile
 import subprocess
 import sys
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, TextIO, BinaryIO
 
+from darija_cache import cache_dir
 from darija_ir import (
-    IRProgram, IRFuncDef, IRNode, IRLabel, IRGoto, IRConditionalGoto,
-    IRBinOp, IRUnaryOp, IRCall, IRStore, IRReturn, IRTryCatch, IRThrow
+    IRProgram, IRFuncDef, IRNode, IRLabel, IRGoto, IRConditionalGoto, IRCondJumpIfFalse,
+    IRBinOp, IRUnaryOp, IRCall, IRStore, IRReturn, IRTryCatch, IRThrow, IRStringRef
 )
 
+# Runtime functions returning void; their result is never assigned
+_VOID_FUNCS = frozenset(("tba3", "tba3_str"))
+
+# Map DarijaLang unary ops to C
+_UNARY_OPS = {'-': '-', '!': '!'}
+
+# Line templates for the most frequent instructions; {0} is the indentation
+_BINOP_T = "{0}{1} = {2} {3} {4};\n"
+_STORE_T = "{0}{1} = {2};\n"
+_CALL_VOID_T = "{0}{1}({2});\n"
+_CALL_ASSIGN_T = "{0}{1} = {2}({3});\n"
+_CGOTO_T = "{0}if (!{1}) goto {2};\n"
+
+# Pure single-int-argument recursive functions (IRFuncDef.memoize) cache
+# their results for arguments in [0, _MEMO_SIZE) behind a wrapper:
+# {0} is the function, {1} its parameter, {2} the helper prefix, {3} the size
+_MEMO_SIZE = 1024
+_MEMO_IMPL_PREFIX = "__darija_impl_"
+_MEMO_WRAPPER_T = """int {0}(int {1}) {{
+    static int memo[{3}];
+    static char known[{3}];
+    if ({1} < 0 || {1} >= {3}) return {2}{0}({1});
+    if (!known[{1}]) {{
+        memo[{1}] = {2}{0}({1});
+        known[{1}] = 1;
+    }}
+    return memo[{1}];
+}}
+
+"""
+
+# String pool entries are emitted once as named arrays, escaped for C
+_STRING_POOL_T = "static const char __darija_str{0}[] = \"{1}\";\n"
+_C_STRING_ESCAPES = str.maketrans({
+    '\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r', '\t': '\\t', '\0': '\\000',
+})
+
 class CEmitter:
     """Converts IR code to C source code."""
 
@@ -26,44 +68,92 @@ class CEmitter:
             "union", "unsigned", "void", "volatile", "while"
         }
         self.used_identifiers: Set[str] = set()
+        self._jmp_counter = 0
+        # Memoised safe_identifier results; names repeat heavily within a program
+        self._safe_cache: Dict[str, str] = {}
+        # Memoised C text of string operands (variable names and literals)
+        self._operand_cache: Dict[str, str] = {}
+        # Output buffers, allocated once and rewound on reuse: _text collects
+        # the translation unit when emit() has no output stream to write to,
+        # _buf holds the body of the function being emitted
+        self._text = io.StringIO()
+        self._out = self._text
+        self._buf = io.StringIO()
+        self._indent = 1
+        self._indent_str = "    "
+        # Variables referenced by the current function, in first-use order
+        self._seen: Dict[str, None] = {}
+        # Per-type handlers, looked up once per instruction instead of an isinstance chain
+        self._dispatch = {
+            IRLabel: self._emit_label,
+            IRGoto: self._emit_goto,
+            IRConditionalGoto: self._emit_cgoto,
+            IRCondJumpIfFalse: self._emit_cgoto,
+            IRBinOp: self._emit_binop,
+            IRUnaryOp: self._emit_unop,
+            IRCall: self._emit_call,
+            IRStore: self._emit_store,
+            IRReturn: self._emit_return,
+            IRTryCatch: self._emit_try,
+            IRThrow: self._emit_throw,
+        }
         
     def safe_identifier(self, name: str) -> str:
         """Ensure identifier doesn't clash with C keywords."""
-        if name in self.c_keywords:
-            return f"__d_{name}"
-        return name
+        safe = self._safe_cache.get(name)
+        if safe is None:
+            safe = f"__d_{name}" if name in self.c_keywords else name
+            self._safe_cache[name] = safe
+        return safe
     
-    def emit(self, ir_program: IRProgram) -> str:
-        """Generate C code from IR program."""
-        result = [
-            '#include "darija_runtime.h"\n\n',
-            '/* Generated C code from DarijaLang */\n\n'
-        ]
+    def emit(self, ir_program: IRProgram, out: Optional[TextIO] = None) -> Optional[str]:
+        """Generate C code from IR program.
+        
+        With an ``out`` stream the code is written to it function by function
+        and nothing is returned; otherwise the code is returned as a string.
+        """
+        if out is None:
+            self._text.seek(0)
+            self._text.truncate()
+            self._out = self._text
+        else:
+            self._out = out
+        write = self._out.write
+        write('#include "darija_runtime.h"\n\n')
+        write('/* Generated C code from DarijaLang */\n\n')
+        
+        # String literals, referenced by name from the function bodies
+        if ir_program.string_pool:
+            for i, text in enumerate(ir_program.string_pool):
+                write(_STRING_POOL_T.format(i, text.translate(_C_STRING_ESCAPES)))
+            write("\n")
         
         # Generate function definitions
         for func in ir_program.functions:
-            result.append(self._emit_function(func))
+            self._emit_function(func)
             
         # Add main function stub if not defined
-        if not any(f.name == "main" for f in ir_program.functions):
+        by_name = {f.name: f for f in ir_program.functions}
+        if "main" not in by_name:
             # Look for bda function (our conventional entry point)
-            entry_func = next((f.name for f in ir_program.functions if f.name == "bda"), 
-                             ir_program.functions[0].name if ir_program.functions else "bda")
+            entry = by_name.get("bda") or (ir_program.functions[0] if ir_program.functions else None)
+            entry_func = entry.name if entry else "bda"
             
             # Determine if the entry function needs parameters
             entry_params_str = ""
-            for func in ir_program.functions:
-                if func.name == entry_func and func.params:
-                    entry_params_str = ", ".join(["5"] * len(func.params))  # Default args
+            if entry and entry.params:
+                entry_params_str = ", ".join(["5"] * len(entry.params))  # Default args
             
-            result.append(f"\n/* Main stub for program entry */\n")
-            result.append(f"int main(void) {{\n")
-            result.append(f"    return {self.safe_identifier(entry_func)}({entry_params_str});\n")
-            result.append("}\n")
+            write(f"\n/* Main stub for program entry */\n")
+            write(f"int main(void) {{\n")
+            write(f"    return {self.safe_identifier(entry_func)}({entry_params_str});\n")
+            write("}\n")
             
-        return "".join(result)
+        if out is None:
+            return self._text.getvalue()
+        return None
     
-    def _emit_function(self, func: IRFuncDef) -> str:
+    def _emit_function(self, func: IRFuncDef) -> None:
         """Generate C code for a function definition."""
         # For simplicity, all functions return int
         # In a full implementation, we'd map DarijaLang types to C types
@@ -77,207 +167,227 @@ class CEmitter:
                 params.append(f"int {safe_param}")
         params_str = ", ".join(params) if params else "void"
         
-        result = [f"int {func_name}({params_str}) {{\n"]
+        # Single pass over the body: instructions are emitted into self._buf
+        # while the variables they reference are recorded in self._seen, then
+        # the declarations are written ahead of the buffered body.
+        # Every _emit_* method writes straight into self._buf; nested blocks
+        # raise the indent level instead of re-indenting already generated text
+        self._buf.seek(0)
+        self._buf.truncate()
+        self._set_indent(1)
+        self._seen.clear()
+        for instr in func.body:
+            self._emit_instruction(instr)
+        
+        # Parameters are already declared in the signature
+        all_vars = self._seen
+        if func.params:
+            for param in func.params:
+                all_vars.pop(param, None)
         
-        # Find all variables to declare at the beginning
-        all_vars = self._collect_variables(func)
+        write = self._out.write
+        if func.memoize:
+            # The body becomes a static helper; its recursive calls go
+            # through the public, caching wrapper emitted after it
+            write(f"int {func_name}({params_str});\n")
+            write(f"static int {_MEMO_IMPL_PREFIX}{func_name}({params_str}) {{\n")
+        else:
+            write(f"int {func_name}({params_str}) {{\n")
         
         # Declare all variables at the beginning of the function
         for var in all_vars:
-            result.append(f"    int {self.safe_identifier(var)};\n")
+            write(f"    int {self.safe_identifier(var)};\n")
         
         if all_vars:
-            result.append("\n")
+            write("\n")
         
-        # Emit function body
-        for instr in func.body:
-            result.append(self._emit_instruction(instr))
-            
-        result.append("}\n\n")
-        return "".join(result)
+        write(self._buf.getvalue())
+        write("}\n\n")
+        if func.memoize:
+            write(_MEMO_WRAPPER_T.format(func_name, self.safe_identifier(func.params[0]),
+                                         _MEMO_IMPL_PREFIX, _MEMO_SIZE))
+
+    def _set_indent(self, level: int) -> None:
+        """Change the nesting level and cache its indentation prefix."""
+        self._indent = level
+        self._indent_str = "    " * level
 
-    def _collect_variables(self, func: IRFuncDef) -> Set[str]:
-        """Collect all variables used in a function."""
-        all_vars = set()
+    def _emit_instruction(self, instr: IRNode) -> None:
+        """Generate C code for an IR instruction into the output buffer."""
+        node_type = type(instr)
         
-        # Helper function to process instruction and collect variables
-        def process_instruction(instr):
-            if isinstance(instr, IRBinOp):
-                all_vars.add(instr.target_temp_var)
-                if isinstance(instr.left_operand, str) and instr.left_operand.isidentifier():
-                    all_vars.add(instr.left_operand)
-                if isinstance(instr.right_operand, str) and instr.right_operand.isidentifier():
-                    all_vars.add(instr.right_operand)
-                    
-            elif isinstance(instr, IRUnaryOp):
-                all_vars.add(instr.target_temp_var)
-                if isinstance(instr.operand, str) and instr.operand.isidentifier():
-                    all_vars.add(instr.operand)
-                    
-            elif isinstance(instr, IRCall):
-                if instr.target_temp_var:
-                    all_vars.add(instr.target_temp_var)
-                for arg in instr.args:
-                    if isinstance(arg, str) and arg.isidentifier():
-                        all_vars.add(arg)
-                        
-            elif isinstance(instr, IRStore):
-                all_vars.add(instr.target_var)
-                if isinstance(instr.source_var_or_const, str) and instr.source_var_or_const.isidentifier():
-                    all_vars.add(instr.source_var_or_const)
-                    
-            elif isinstance(instr, IRConditionalGoto):
-                if isinstance(instr.condition_var, str) and instr.condition_var.isidentifier():
-                    all_vars.add(instr.condition_var)
-                    
-            elif isinstance(instr, IRReturn):
-                if isinstance(instr.value_var_or_const, str) and instr.value_var_or_const.isidentifier():
-                    all_vars.add(instr.value_var_or_const)
-                    
-            # Handle try-catch blocks recursively
-            elif isinstance(instr, IRTryCatch):
-                # Process try body
-                for try_instr in instr.try_body:
-                    process_instruction(try_instr)
-                    
-                # Add catch variable
-                all_vars.add(instr.catch_var)
-                    
-                # Process catch body
-                for catch_instr in instr.catch_body:
-                    process_instruction(catch_instr)
-                    
-            elif isinstance(instr, IRThrow):
-                if isinstance(instr.value_var_or_const, str) and instr.value_var_or_const.isidentifier():
-                    all_vars.add(instr.value_var_or_const)
+        # Record referenced variables; constants and string literals are
+        # skipped by the isidentifier() check
+        seen = self._seen
+        for attr in node_type.var_fields:
+            value = getattr(instr, attr)
+            if type(value) is str:
+                if value.isidentifier():
+                    seen[value] = None
+            elif type(value) is list:
+                for item in value:
+                    if type(item) is str and item.isidentifier():
+                        seen[item] = None
         
-        # Process each instruction in the function body
-        for instr in func.body:
-            process_instruction(instr)
+        self._dispatch.get(node_type, self._emit_unknown)(instr)
+
+    def _emit_label(self, instr: IRLabel) -> None:
+        # Labels sit one level left of the statements around them.
+        # In C, labels can't directly precede declarations - add a dummy statement
+        self._buf.write(f"{self._indent_str[4:]}{instr.name}: ;\n")
+
+    def _emit_goto(self, instr: IRGoto) -> None:
+        self._buf.write(f"{self._indent_str}goto {instr.label};\n")
+
+    def _emit_cgoto(self, instr) -> None:
+        # IRConditionalGoto and IRCondJumpIfFalse both fall through when true
+        # Note: C uses ! for negation
+        cond_var = self._format_operand(instr.condition_var)
+        self._buf.write(_CGOTO_T.format(self._indent_str, cond_var, instr.false_label))
+
+    def _emit_binop(self, instr: IRBinOp) -> None:
+        target = self.safe_identifier(instr.target_temp_var)
+        left = self._format_operand(instr.left_operand)
+        right = self._format_operand(instr.right_operand)
+        self._buf.write(_BINOP_T.format(self._indent_str, target, left, instr.op, right))
+
+    def _emit_unop(self, instr: IRUnaryOp) -> None:
+        target = self.safe_identifier(instr.target_temp_var)
+        operand = self._format_operand(instr.operand)
+        if operand[0] == '-':
+            # Negative constant (one the folder left alone): "--N" would
+            # read as a decrement
+            operand = f"({operand})"
+        c_op = _UNARY_OPS.get(instr.op, instr.op)
+        self._buf.write(f"{self._indent_str}{target} = {c_op}{operand};\n")
+
+    def _emit_call(self, instr: IRCall) -> None:
+        func_name = self.safe_identifier(instr.func_name)
+        args = [self._format_operand(arg) for arg in instr.args]
+        args_str = ", ".join(args)
+        indent = self._indent_str
         
-        # Remove parameter names since they're already declared
-        if func.params:
-            for param in func.params:
-                if param in all_vars:
-                    all_vars.remove(param)
-                    
-        return all_vars
-    
-    def _emit_instruction(self, instr: IRNode) -> str:
-        """Generate C code for an IR instruction."""
-        if isinstance(instr, IRLabel):
-            # In C, labels can't directly precede declarations - add a dummy statement
-            return f"{instr.name}: ;\n"
-        elif isinstance(instr, IRGoto):
-            return f"    goto {instr.label};\n"
-        elif isinstance(instr, IRConditionalGoto):
-            # Note: C uses ! for negation
-            cond_var = self.safe_identifier(instr.condition_var)
-            return f"    if (!{cond_var}) goto {instr.false_label};\n"
-        elif isinstance(instr, IRBinOp):
-            target = self.safe_identifier(instr.target_temp_var)
-            left = self._format_operand(instr.left_operand)
-            right = self._format_operand(instr.right_operand)
-            return f"    {target} = {left} {instr.op} {right};\n"
-        elif isinstance(instr, IRUnaryOp):
+        # Special handling for void functions
+        if func_name in _VOID_FUNCS or not instr.target_temp_var:
+            self._buf.write(_CALL_VOID_T.format(indent, func_name, args_str))
+        else:
             target = self.safe_identifier(instr.target_temp_var)
-            operand = self._format_operand(instr.operand)
-            # Map DarijaLang unary ops to C
-            op_map = {'-': '-', '!': '!'}
-            c_op = op_map.get(instr.op, instr.op)
-            return f"    {target} = {c_op}{operand};\n"
-        elif isinstance(instr, IRCall):
-            func_name = self.safe_identifier(instr.func_name)
-            args = [self._format_operand(arg) for arg in instr.args]
-            args_str = ", ".join(args)
-            
-            # Special handling for void functions
-            if func_name in ["tba3", "tba3_str"]:
-                return f"    {func_name}({args_str});\n"
-                
-            if instr.target_temp_var:
-                target = self.safe_identifier(instr.target_temp_var)
-                return f"    {target} = {func_name}({args_str});\n"
-            else:
-                return f"    {func_name}({args_str});\n"
-        elif isinstance(instr, IRStore):
-            target = self.safe_identifier(instr.target_var)
-            source = self._format_operand(instr.source_var_or_const)
-            # All variables are already declared at the beginning, so just assign
-            return f"    {target} = {source};\n"
-        elif isinstance(instr, IRReturn):
-            if instr.value_var_or_const is None:
-                return "    return 0;\n"
-            value = self._format_operand(instr.value_var_or_const)
-            return f"    return {value};\n"
-        elif isinstance(instr, IRTryCatch):
-            # Generate C code for try-catch using setjmp/longjmp
-            try_id = self._new_jmp_id()
-            result = []
-            
-            # Setup try block with setjmp
-            result.append(f"    /* Begin try-catch block {try_id} */\n")
-            result.append(f"    __darija_push_handler({try_id});\n")
-            result.append(f"    if (setjmp(__darija_jmp_buf[__darija_handler_idx - 1]) == 0) {{\n")
-            
-            # Emit try body
-            for try_instr in instr.try_body:
-                # Indent one level more
-                try_code = self._emit_instruction(try_instr).replace("\n", "\n    ")
-                result.append(try_code)
-            
-            # After try body completes normally, skip the catch
-            result.append(f"        /* Try completed normally - pop handler and skip catch */\n")
-            result.append(f"        __darija_pop_handler();\n")
-            result.append(f"    }} else {{\n")
-            result.append(f"        /* Exception caught - execute catch block */\n")
-            
-            # Store exception in catch variable
-            catch_var = self.safe_identifier(instr.catch_var)
-            result.append(f"        char* {catch_var} = __darija_current_exception;\n")
+            self._buf.write(_CALL_ASSIGN_T.format(indent, target, func_name, args_str))
+
+    def _emit_store(self, instr: IRStore) -> None:
+        target = self.safe_identifier(instr.target_var)
+        source = self._format_operand(instr.source_var_or_const)
+        # All variables are already declared at the beginning, so just assign
+        self._buf.write(_STORE_T.format(self._indent_str, target, source))
+
+    def _emit_return(self, instr: IRReturn) -> None:
+        if instr.value_var_or_const is None:
+            self._buf.write(f"{self._indent_str}return 0;\n")
+            return
+        value = self._format_operand(instr.value_var_or_const)
+        self._buf.write(f"{self._indent_str}return {value};\n")
+
+    def _emit_try(self, instr: IRTryCatch) -> None:
+        # Generate C code for try-catch using setjmp/longjmp
+        try_id = self._new_jmp_id()
+        write = self._buf.write
+        indent = self._indent_str
+        inner = indent + '    '
+        
+        # Setup try block with setjmp
+        write(f"{indent}/* Begin try-catch block {try_id} */\n")
+        write(f"{indent}__darija_push_handler({try_id});\n")
+        write(f"{indent}if (setjmp(__darija_jmp_buf[__darija_handler_idx - 1]) == 0) {{\n")
+        
+        self._seen[instr.catch_var] = None
+        
+        # Emit try body one level deeper
+        self._set_indent(self._indent + 1)
+        for try_instr in instr.try_body:
+            self._emit_instruction(try_instr)
+        self._set_indent(self._indent - 1)
+        
+        # After try body completes normally, skip the catch
+        write(f"{inner}/* Try completed normally - pop handler and skip catch */\n")
+        write(f"{inner}__darija_pop_handler();\n")
+        write(f"{indent}}} else {{\n")
+        write(f"{inner}/* Exception caught - execute catch block */\n")
+        
+        # Store exception in catch variable
+        catch_var = self.safe_identifier(instr.catch_var)
+        write(f"{inner}char* {catch_var} = __darija_current_exception;\n")
+        
+        # Emit catch body
+        self._set_indent(self._indent + 1)
+        for catch_instr in instr.catch_body:
+            self._emit_instruction(catch_instr)
+        self._set_indent(self._indent - 1)
             
-            # Emit catch body
-            for catch_instr in instr.catch_body:
-                catch_code = self._emit_instruction(catch_instr).replace("\n", "\n        ")
-                result.append(catch_code)
-                
-            result.append(f"    }}\n")
-            result.append(f"    /* End try-catch block {try_id} */\n")
-            return "".join(result)
-        elif isinstance(instr, IRThrow):
-            value = self._format_operand(instr.value_var_or_const)
-            return f"    __darija_throw({value});\n"
-        else:
-            return f"    /* Unhandled IR instruction: {type(instr).__name__} */\n"
+        write(f"{indent}}}\n")
+        write(f"{indent}/* End try-catch block {try_id} */\n")
+
+    def _emit_throw(self, instr: IRThrow) -> None:
+        value = self._format_operand(instr.value_var_or_const)
+        self._buf.write(f"{self._indent_str}__darija_throw({value});\n")
+
+    def _emit_unknown(self, instr: IRNode) -> None:
+        self._buf.write(f"{self._indent_str}/* Unhandled IR instruction: {type(instr).__name__} */\n")
     
     def _new_jmp_id(self):
         """Generate a new unique ID for jump buffers."""
-        if not hasattr(self, '_jmp_counter'):
-            self._jmp_counter = 0
         self._jmp_counter += 1
         return self._jmp_counter - 1
 
     def _format_operand(self, operand) -> str:
         """Format an operand (variable, literal, etc.) for C code."""
         if isinstance(operand, str):
-            # If it's definitely a string literal (not an identifier), ensure it's quoted
-            if not operand.isidentifier() and not operand.startswith('"'):
-                # Don't double-quote strings that are already quoted
-                return f'"{operand}"'
-            # For variable names or already quoted strings, return as is
-            return self.safe_identifier(operand)
-        elif isinstance(operand, (int, float)):
-            return str(operand)
+            # The same names and literals recur throughout a program, so each
+            # distinct string is classified and formatted only once
+            formatted = self._operand_cache.get(operand)
+            if formatted is None:
+                # If it's definitely a string literal (not an identifier), ensure it's quoted
+                if not operand.isidentifier() and not operand.startswith('"'):
+                    # Don't double-quote strings that are already quoted
+                    formatted = f'"{operand}"'
+                else:
+                    # For variable names or already quoted strings, return as is
+                    formatted = self.safe_identifier(operand)
+                self._operand_cache[operand] = formatted
+            return formatted
+        elif type(operand) is IRStringRef:
+            return f"__darija_str{operand.index}"
         elif operand is True:
             return "1"
         elif operand is False:
             return "0"
+        elif isinstance(operand, (int, float)):
+            return str(operand)
         elif operand is None:
             return "0"
         else:
             # For any other type, convert to string and handle with care
             return f'"{str(operand)}"'
 
+class _TeeWriter:
+    """Minimal text stream that encodes each write once and forwards the
+    bytes to several binary files."""
+
+    def __init__(self, sinks: List[BinaryIO]):
+        self._sinks = sinks
+
+    def write(self, chunk: str) -> None:
+        data = chunk.encode("utf-8")
+        for sink in self._sinks:
+            sink.write(data)
+
+def _runtime_object_path(runtime_c: str, runtime_h: str) -> str:
+    """Cache path of the compiled runtime, keyed by the runtime sources."""
+    digest = hashlib.sha1()
+    for path in (runtime_c, runtime_h):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return os.path.join(cache_dir(), f"darija_runtime-{digest.hexdigest()[:16]}.o")
+
 def compile_and_run(source: str, keep_c: bool = False, output_path: Optional[str] = None) -> int:
     """
     Compile DarijaLang source to C, then compile and run the C code.
@@ -289,6 +399,9 @@ def compile_and_run(source: str, keep_c: bool = False, output_path: Optional[str
         
     Returns:
         The exit code from running the compiled program
+    
+    Set the DARIJA_DEBUG environment variable to dump the AST, the IR and
+    the generated C (to debug_output.c) along the way.
     """
     from darija_parser import parse
     from darija_ir import generate_ir
@@ -299,80 +412,185 @@ def compile_and_run(source: str, keep_c: bool = False, output_path: Optional[str
     # Generate IR
     ir = generate_ir(ast)
     
-    # Generate C code
     emitter = CEmitter()
-    c_code = emitter.emit(ir)
-    
-    # Always save debug output during development
-    debug_c_path = "debug_output.c"
-    with open(debug_c_path, "w") as f:
-        f.write(c_code)
-    print(f"Generated C code saved to: {debug_c_path}")
+    debug = bool(os.environ.get("DARIJA_DEBUG"))
     
     # Include more verbose debug info
-    print("\nAST structure:")
-    print(ast)
-    
-    print("\nIR structure:")
-    for func in ir.functions:
-        print(f"Function: {func.name}")
-        for i, instr in enumerate(func.body):
-            print(f"  [{i}] {type(instr).__name__}: {instr}")
+    if debug:
+        print("\nAST structure:")
+        print(ast)
+        
+        print("\nIR structure:")
+        for func in ir.functions:
+            print(f"Function: {func.name}")
+            for i, instr in enumerate(func.body):
+                print(f"  [{i}] {type(instr).__name__}: {instr}")
     
     # Create temporary directory for build artifacts
     with tempfile.TemporaryDirectory() as temp_dir:
-        # Write generated C code to file
-        c_file_path = os.path.join(temp_dir, "prog.c")
-        with open(c_file_path, "w") as f:
-            f.write(c_code)
-        
         # Copy runtime files to the temporary directory
         runtime_dir = os.path.dirname(os.path.abspath(__file__))
         runtime_h = os.path.join(runtime_dir, "darija_runtime.h")
         runtime_c = os.path.join(runtime_dir, "darija_runtime.c")
         
-        # Copy header to temp dir
+        # Copy header to temp dir; a hard link is O(1) when both paths live
+        # on the same filesystem, otherwise copy the bytes without decoding
         temp_runtime_h = os.path.join(temp_dir, "darija_runtime.h")
-        with open(runtime_h, "r") as src, open(temp_runtime_h, "w") as dst:
-            dst.write(src.read())
-        
-        # Copy implementation to temp dir
-        temp_runtime_c = os.path.join(temp_dir, "darija_runtime.c") 
-        with open(runtime_c, "r") as src, open(temp_runtime_c, "w") as dst:
-            dst.write(src.read())
+        try:
+            os.link(runtime_h, temp_runtime_h)
+        except OSError:
+            shutil.copyfile(runtime_h, temp_runtime_h)
         
         # Default output path if not specified
+        # Absolute, so the program is run from that path rather than looked
+        # up on PATH when a bare name like "myprog" is given
         if not output_path:
             output_path = os.path.join(temp_dir, "prog.out")
+        output_path = os.path.abspath(output_path)
+        kept_c_path = f"{output_path}.c"
         
-        # Compile with gcc - now using the copied runtime files
-        compile_cmd = [
-            "gcc", "-std=c11", "-O2", c_file_path, temp_runtime_c,
-            "-o", output_path
-        ]
+        # The runtime is the same for every program: reuse its object file
+        # from the cache, or compile it in the background (into the cache
+        # when that is writable) while the program itself is compiled from
+        # stdin as the emitter produces it
+        runtime_obj = _runtime_object_path(runtime_c, runtime_h)
+        runtime_proc = None
+        if not os.path.exists(runtime_obj):
+            try:
+                os.makedirs(os.path.dirname(runtime_obj), exist_ok=True)
+                pending_obj = f"{runtime_obj}.{os.getpid()}.tmp"
+            except OSError:
+                runtime_obj = pending_obj = os.path.join(temp_dir, "darija_runtime.o")
+            runtime_proc = subprocess.Popen(
+                ["gcc", "-std=c11", "-O2", "-c", runtime_c, "-o", pending_obj]
+            )
+        prog_obj = os.path.join(temp_dir, "prog.o")
+        prog_proc = subprocess.Popen(
+            ["gcc", "-std=c11", "-O2", "-I", temp_dir, "-xc", "-c", "-", "-o", prog_obj],
+            stdin=subprocess.PIPE,
+        )
         
+        # Generate C code, streaming it to every destination in one pass
+        debug_c_path = "debug_output.c"
         try:
-            subprocess.run(compile_cmd, check=True)
+            with contextlib.ExitStack() as stack:
+                sinks = [stack.enter_context(prog_proc.stdin)]
+                if debug:
+                    sinks.append(stack.enter_context(open(debug_c_path, "wb")))
+                if keep_c:
+                    sinks.append(stack.enter_context(open(kept_c_path, "wb")))
+                emitter.emit(ir, _TeeWriter(sinks))
+        except BrokenPipeError:
+            pass  # gcc stopped reading early; its exit status reports why
+        finally:
+            prog_status = prog_proc.wait()
+            runtime_status = runtime_proc.wait() if runtime_proc else 0
+        if debug:
+            print(f"Generated C code saved to: {debug_c_path}")
+        
+        # Publish a freshly compiled runtime atomically so concurrent runs
+        # never link a half-written object
+        if runtime_proc and runtime_status == 0 and pending_obj != runtime_obj:
+            os.replace(pending_obj, runtime_obj)
+        
+        if prog_status != 0 or runtime_status != 0:
+            print("Compilation error: gcc failed to compile the generated C code", file=sys.stderr)
+            return 1
+        
+        # Link the two objects
+        link_cmd = ["gcc", prog_obj, runtime_obj, "-o", output_path]
+        
+        try:
+            subprocess.run(link_cmd, check=True)
             
-            # Keep generated C files if requested
+            # Generated C was kept alongside the executable if requested
             if keep_c:
-                kept_c_path = f"{output_path}.c"
-                with open(c_file_path, "r") as src, open(kept_c_path, "w") as dst:
-                    dst.write(src.read())
                 print(f"Generated C code saved to: {kept_c_path}")
             
-            # Run the compiled program
-            run_result = subprocess.run([output_path], capture_output=True)
-            print(run_result.stdout.decode('utf-8'))  # Print program output
-            if run_result.stderr:
-                print("Error output:", file=sys.stderr)
-                print(run_result.stderr.decode('utf-8'), file=sys.stderr)
+            # Run the compiled program; it inherits our stdout/stderr so its
+            # output streams straight to the terminal instead of being buffered
+            sys.stdout.flush()
+            sys.stderr.flush()
+            run_result = subprocess.run([output_path])
             return run_result.returncode
             
         except subprocess.CalledProcessError as e:
             print(f"Compilation error: {e}", file=sys.stderr)
             return 1
 
+def compile_batch(sources: List[str], output_dir: str) -> List[Optional[str]]:
+    """
+    Compile several DarijaLang programs to executables in *output_dir*.
+
+    All generated C files (plus the runtime, when it is not cached yet) go
+    through a single gcc invocation, so the compiler starts once for the
+    whole batch; the per-program links then run concurrently.
+
+    Args:
+        sources: DarijaLang source code of each program
+        output_dir: Existing directory for the C, object and executable files
+
+    Returns:
+        The executable path of each program, or None where compilation failed
+    """
+    from darija_parser import parse
+    from darija_ir import generate_ir
+
+    runtime_dir = os.path.dirname(os.path.abspath(__file__))
+    runtime_h = os.path.join(runtime_dir, "darija_runtime.h")
+    runtime_c = os.path.join(runtime_dir, "darija_runtime.c")
+
+    emitter = CEmitter()
+    c_files = []
+    for i, source in enumerate(sources):
+        c_path = os.path.join(output_dir, f"prog{i}.c")
+        with open(c_path, "w", encoding="utf-8") as f:
+            emitter.emit(generate_ir(parse(source)), f)
+        c_files.append(c_path)
+
+    runtime_obj = _runtime_object_path(runtime_c, runtime_h)
+    compile_runtime = not os.path.exists(runtime_obj)
+    units = c_files + [runtime_c] if compile_runtime else c_files
+    # gcc -c keeps going after a failing unit, so each missing object file
+    # marks exactly the programs that did not compile
+    subprocess.run(
+        ["gcc", "-std=c11", "-O2", "-pipe", "-I", runtime_dir, "-c", *units],
+        cwd=output_dir,
+    )
+    if compile_runtime:
+        built_obj = os.path.join(output_dir, "darija_runtime.o")
+        if not os.path.exists(built_obj):
+            print("Compilation error: gcc failed to compile the runtime", file=sys.stderr)
+            return [None] * len(sources)
+        # Publish to the cache atomically, as compile_and_run does
+        try:
+            os.makedirs(os.path.dirname(runtime_obj), exist_ok=True)
+            pending_obj = f"{runtime_obj}.{os.getpid()}.tmp"
+            shutil.copyfile(built_obj, pending_obj)
+            os.replace(pending_obj, runtime_obj)
+        except OSError:
+            runtime_obj = built_obj
+
+    # The links are independent: start them all, then collect the results
+    links = []
+    for c_path in c_files:
+        stem = os.path.splitext(c_path)[0]
+        prog_obj = f"{stem}.o"
+        exe_path = f"{stem}.out"
+        link_proc = None
+        if os.path.exists(prog_obj):
+            link_proc = subprocess.Popen(["gcc", prog_obj, runtime_obj, "-o", exe_path])
+        links.append((c_path, exe_path, link_proc))
+
+    executables: List[Optional[str]] = []
+    for c_path, exe_path, link_proc in links:
+        if link_proc is not None and link_proc.wait() == 0:
+            executables.append(exe_path)
+        else:
+            print(f"Compilation error: gcc failed to compile {c_path}", file=sys.stderr)
+            executables.append(None)
+    return executables
+
 if __name__ == "__main__":
     # CLI for testing the emitter
     if len(sys.argv) < 2:
@@ -388,16 +606,15 @@ if __name__ == "__main__":
     
     output_path = None
     if output_idx >= 0 and output_idx + 1 < len(sys.argv):
-        output_path = output_idx + 1
+        output_path = sys.argv[output_idx + 1]
     
     try:
         with open(source_path, "r") as f:
             source = f.read()
-        exit_code = compile_and_run(source, keep_c, output_path)
-        sys.exit(exit_code)
     except FileNotFoundError:
         print(f"File not found: {source_path}")
         sys.exit(1)
+    sys.exit(compile_and_run(source, keep_c, output_path))
 
 
 
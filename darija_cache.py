@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""darija_cache.py - Location of the per-user build cache
+
+Shared by the parser (pickled LALR tables), the C emitter (compiled
+runtime object) and the pipeline cache (generated C); importing it has no
+side effects.
+"""
+
+import os
+
+def cache_dir() -> str:
+    """Per-user cache directory for build artifacts reused across runs."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return os.path.join(os.path.expanduser(base), "darijalang")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""darija_fold.py - Constant folding with C int semantics
+
+Shared by the parser, which folds integer arithmetic on literals while
+reducing expressions, and the IR generator, which folds every operation
+whose operands are known. Results are what the generated C would store
+into an int temp: comparisons and logic give 0/1, division truncates
+toward zero, and values outside the int range are not folded.
+"""
+
+import operator
+from typing import Any, Optional
+
+C_INT_MIN, C_INT_MAX = -2**31, 2**31 - 1
+
+# Arithmetic operators, the only ones folded on literals in the parser
+ARITH_OPS = frozenset(('+', '-', '*', '/'))
+
+_BINARY_OPS = {
+    '+': operator.add, '-': operator.sub, '*': operator.mul,
+    '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+    '==': operator.eq, '!=': operator.ne,
+    '&&': lambda l, r: bool(l) and bool(r), 'ou': lambda l, r: bool(l) and bool(r),
+    '||': lambda l, r: bool(l) or bool(r),
+}
+_UNARY_OPS = {'-': operator.neg, '!': operator.not_}
+_FOLDABLE_TYPES = (int, float, bool)
+
+def c_int(value) -> Optional[int]:
+    """Convert a folded value as C would store it into an int temp, or None
+    when it does not fit."""
+    value = int(value)
+    return value if C_INT_MIN <= value <= C_INT_MAX else None
+
+def fold_binop(op: str, left: Any, right: Any) -> Optional[int]:
+    if type(left) not in _FOLDABLE_TYPES or type(right) not in _FOLDABLE_TYPES:
+        return None
+    if op == '/':
+        if right == 0:
+            return None  # leave the runtime behaviour to C
+        if type(left) is float or type(right) is float:
+            return c_int(left / right)
+        quotient = abs(left) // abs(right)  # C truncates toward zero
+        return c_int(quotient if (left < 0) == (right < 0) else -quotient)
+    fold = _BINARY_OPS.get(op)
+    return None if fold is None else c_int(fold(left, right))
+
+def fold_unaryop(op: str, operand: Any) -> Optional[int]:
+    if type(operand) not in _FOLDABLE_TYPES:
+        return None
+    fold = _UNARY_OPS.get(op)
+    return None if fold is None else c_int(fold(operand))
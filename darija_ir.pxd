@@ -0,0 +1,21 @@
+# darija_ir.pxd - static declarations for the optional compiled build
+#
+# Cython reads this file alongside darija_ir.py (see setup.py) and turns
+# ASTtoIRVisitor into a cdef class with typed attributes. The .py module is
+# unchanged and still runs as plain Python when no extension is built.
+
+cdef class ASTtoIRVisitor:
+    cdef public list ir_code_stream
+    cdef public int temp_var_count
+    cdef public int label_count
+    cdef public list current_function_params
+    cdef public list loop_stack
+    cdef list _stream_stack
+    cdef dict _cse_cache
+    cdef dict _cse_uses
+    cdef dict _string_pool
+    cdef dict _dispatch
+
+    cpdef visit(self, node)
+    cpdef str _new_temp(self)
+    cpdef str _new_label(self, str prefix=*)
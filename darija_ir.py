@@ -1,103 +1,292 @@
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
-from typing import List, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
 import darija_parser as ast # To reference AST node types
+from darija_fold import fold_binop, fold_unaryop
 
 # --- IR Node Definitions ---
-@dataclass
+@dataclass(slots=True)
 class IRNode:
     """Base class for all IR instructions."""
-    pass
+    # Names of the attributes that may hold variable/temp names, read by the
+    # C emitter to collect declarations (class-level, not dataclass fields)
+    var_fields = ()
 
-@dataclass
+@dataclass(slots=True)
 class IRLabel(IRNode):
     name: str  # e.g., L0, L1, func_start_main
 
-@dataclass
+@dataclass(slots=True)
 class IRGoto(IRNode): # Unconditional jump
     label: str
 
-@dataclass
+@dataclass(slots=True)
 class IRConditionalGoto(IRNode): # Conditional jump
     condition_var: str  # Variable holding the boolean result of the condition
     true_label: str
     false_label: str
 
+    var_fields = ("condition_var",)
+
+@dataclass(slots=True)
+class IRCondJumpIfFalse(IRNode): # Jump when the condition is false, fall through otherwise
+    condition_var: Any  # Variable (or folded constant) holding the condition
+    false_label: str
+
+    var_fields = ("condition_var",)
+
 # Operations that produce a value into a temporary variable
-@dataclass
+@dataclass(slots=True)
 class IRBinOp(IRNode):
     target_temp_var: str
     op: str
     left_operand: Any  # Can be var name (str), temp name (str), or constant
     right_operand: Any # Can be var name (str), temp name (str), or constant
 
-@dataclass
+    var_fields = ("target_temp_var", "left_operand", "right_operand")
+
+@dataclass(slots=True)
 class IRUnaryOp(IRNode):
     target_temp_var: str
     op: str
     operand: Any # Can be var name (str), temp name (str), or constant
 
-@dataclass
+    var_fields = ("target_temp_var", "operand")
+
+@dataclass(slots=True)
 class IRCall(IRNode):
     func_name: str
     args: List[Any]  # List of var names (str), temp names (str), or constants
     target_temp_var: Optional[str] = None  # Temp variable to store the result, if any
+    # One ARG_* byte per argument, tagged once here so consumers need no type() dispatch
+    arg_kinds: bytes = field(init=False, repr=False, compare=False)
+
+    var_fields = ("target_temp_var", "args")
+
+    def __post_init__(self):
+        kind_of = _ARG_KIND_OF.get
+        self.arg_kinds = bytes([kind_of(type(a), ARG_CONST) for a in self.args])
 
 # Operations that do not necessarily produce a value or store into program variables
-@dataclass
+@dataclass(slots=True)
 class IRStore(IRNode):
     target_var: str  # Program variable name
     source_var_or_const: Any  # Temp/var name (str) or constant value to store
 
-@dataclass
+    var_fields = ("target_var", "source_var_or_const")
+
+@dataclass(slots=True)
 class IRReturn(IRNode):
     value_var_or_const: Optional[Any] = None  # Temp/var name (str) or constant value to return
 
+    var_fields = ("value_var_or_const",)
+
 # Add these IR node classes for exception handling
-@dataclass
+@dataclass(slots=True)
 class IRTryCatch(IRNode):
     try_body: List[IRNode]
     catch_var: str  # Name of the exception variable
     catch_body: List[IRNode]
 
-@dataclass
+@dataclass(slots=True)
 class IRThrow(IRNode):
     value_var_or_const: Any  # Expression to throw
 
+    var_fields = ("value_var_or_const",)
+
 # Function and Program Structure
-@dataclass
+@dataclass(slots=True)
 class IRFuncDef(IRNode):
     name: str
     params: List[str]  # List of parameter names
     body: List[IRNode]  # Sequence of IR instructions for the function body
+    memoize: bool = False  # Pure self-recursive int -> int function, see _is_memoizable
 
-@dataclass
+@dataclass(slots=True)
 class IRProgram(IRNode):
     functions: List[IRFuncDef]
+    # Distinct string literals of the program; IRStringRef(i) names string_pool[i]
+    string_pool: List[str] = field(default_factory=list)
+
+# --- Operands ---
+@dataclass(frozen=True, slots=True)
+class IRStringRef:
+    """Operand referring to an entry of IRProgram.string_pool. Unlike a bare
+    str it can never be mistaken for a variable name."""
+    index: int
+
+# Argument kinds recorded in IRCall.arg_kinds
+ARG_CONST, ARG_NAME, ARG_STRING_REF = 0, 1, 2
+ARG_KIND_NAMES = ("const", "name", "string_ref")
+_ARG_KIND_OF = {str: ARG_NAME, IRStringRef: ARG_STRING_REF}
+
+# --- Peephole clean-up of label/goto sequences ---
+def _collect_label_runs(body: List[IRNode], rename: dict) -> None:
+    """Map every label directly followed by another label onto the last
+    label of the run."""
+    for i in range(len(body) - 1, -1, -1):
+        instr = body[i]
+        if isinstance(instr, IRLabel):
+            if i + 1 < len(body) and isinstance(body[i + 1], IRLabel):
+                nxt = body[i + 1].name
+                rename[instr.name] = rename.get(nxt, nxt)
+        elif isinstance(instr, IRTryCatch):
+            _collect_label_runs(instr.try_body, rename)
+            _collect_label_runs(instr.catch_body, rename)
+
+def _retarget(body: List[IRNode], rename: dict, referenced: set) -> None:
+    """Apply *rename* to every jump and collect the labels still jumped to."""
+    for instr in body:
+        if isinstance(instr, IRGoto):
+            instr.label = rename.get(instr.label, instr.label)
+            referenced.add(instr.label)
+        elif isinstance(instr, IRConditionalGoto):
+            instr.true_label = rename.get(instr.true_label, instr.true_label)
+            instr.false_label = rename.get(instr.false_label, instr.false_label)
+            referenced.add(instr.true_label)
+            referenced.add(instr.false_label)
+        elif isinstance(instr, IRCondJumpIfFalse):
+            instr.false_label = rename.get(instr.false_label, instr.false_label)
+            referenced.add(instr.false_label)
+        elif isinstance(instr, IRTryCatch):
+            _retarget(instr.try_body, rename, referenced)
+            _retarget(instr.catch_body, rename, referenced)
+
+def _sweep(body: List[IRNode], referenced: set) -> List[IRNode]:
+    """Drop unreferenced labels and gotos to the label right after them."""
+    out: List[IRNode] = []
+    for instr in body:
+        if isinstance(instr, IRLabel):
+            if instr.name not in referenced:
+                continue
+            if out and isinstance(out[-1], IRGoto) and out[-1].label == instr.name:
+                out.pop()
+        elif isinstance(instr, IRTryCatch):
+            instr.try_body = _sweep(instr.try_body, referenced)
+            instr.catch_body = _sweep(instr.catch_body, referenced)
+        out.append(instr)
+    return out
+
+def _peephole(body: List[IRNode]) -> List[IRNode]:
+    """Merge adjacent labels, drop labels nothing jumps to and drop gotos
+    that only fall through to the next instruction."""
+    rename: dict = {}
+    _collect_label_runs(body, rename)
+    referenced: set = set()
+    _retarget(body, rename, referenced)
+    return _sweep(body, referenced)
+
+# --- Purity analysis for memoized recursion ---
+def _is_memoizable(node: ast.FuncDef, body: List[IRNode]) -> bool:
+    """A function can have its results cached when it takes a single int,
+    calls itself at least once and nothing else, and neither throws nor
+    catches: its result then depends on the argument alone."""
+    params = node.params
+    if not params or len(params) != 1 or params[0][0] != 'int' or node.return_type != 'int':
+        return False
+    self_calls = 0
+    for instr in body:
+        instr_type = type(instr)
+        if instr_type is IRCall:
+            if instr.func_name != node.name:
+                return False
+            self_calls += 1
+        elif instr_type is IRThrow or instr_type is IRTryCatch:
+            return False
+    return self_calls > 0
 
 # --- AST to IR Visitor ---
+# Expressions whose visitor can write its result straight into a variable
+_RETARGETABLE = (ast.BinOp, ast.UnaryOp, ast.FuncCall)
+
 class ASTtoIRVisitor:
+    # Interned temp/label names shared by all visitors, grown on demand
+    _TEMP_POOL: List[str] = []
+    _LABEL_POOLS: Dict[str, Dict[int, str]] = {}
+
     def __init__(self):
         self.ir_code_stream: List[IRNode] = [] # Current stream being built (e.g., for a function body)
         self.temp_var_count = 0
         self.label_count = 0
         self.current_function_params: List[str] = []
         self.loop_stack: List[Tuple[str, str]] = [] # Stack of (continue_label, break_label)
+        self._stream_stack: List[List[IRNode]] = [] # Enclosing streams while a function/try body is built
+        # Common subexpression cache: (op, operand types/values) -> temp holding
+        # the result, plus the keys to drop when a name they read is written
+        self._cse_cache: Dict[tuple, str] = {}
+        self._cse_uses: Dict[str, List[tuple]] = {}
+        # String literal -> its IRStringRef, in pool order
+        self._string_pool: Dict[str, IRStringRef] = {}
+        # AST node type -> visit method; replaces a per-node getattr lookup
+        self._dispatch = {
+            ast.Program: self.visit_Program,
+            ast.FuncDef: self.visit_FuncDef,
+            ast.Compound: self.visit_Compound,
+            ast.VarDecl: self.visit_VarDecl,
+            ast.Assignment: self.visit_Assignment,
+            ast.ConstLiteral: self.visit_ConstLiteral,
+            ast.Identifier: self.visit_Identifier,
+            ast.BinOp: self.visit_BinOp,
+            ast.UnaryOp: self.visit_UnaryOp,
+            ast.IfStmt: self.visit_IfStmt,
+            ast.WhileStmt: self.visit_WhileStmt,
+            ast.ForStmt: self.visit_ForStmt,
+            ast.FuncCall: self.visit_FuncCall,
+            ast.ReturnStmt: self.visit_ReturnStmt,
+            ast.BreakStmt: self.visit_BreakStmt,
+            ast.ContinueStmt: self.visit_ContinueStmt,
+            ast.TryStmt: self.visit_TryStmt,
+            ast.ThrowStmt: self.visit_ThrowStmt,
+        }
 
     def _new_temp(self) -> str:
-        self.temp_var_count += 1
-        return f"t{self.temp_var_count - 1}"
+        n = self.temp_var_count
+        self.temp_var_count = n + 1
+        pool = ASTtoIRVisitor._TEMP_POOL
+        while len(pool) <= n:
+            pool.append(sys.intern(f"t{len(pool)}"))
+        return pool[n]
 
     def _new_label(self, prefix="L") -> str:
-        self.label_count += 1
-        return f"{prefix}{self.label_count - 1}"
+        n = self.label_count
+        self.label_count = n + 1
+        # Label numbers are shared across prefixes, so each prefix pool is
+        # keyed by number rather than filled densely
+        pool = ASTtoIRVisitor._LABEL_POOLS.get(prefix)
+        if pool is None:
+            pool = ASTtoIRVisitor._LABEL_POOLS[prefix] = {}
+        name = pool.get(n)
+        if name is None:
+            name = pool[n] = sys.intern(f"{prefix}{n}")
+        return name
+
+    def _cse_remember(self, key: tuple, result: str, operands: tuple) -> None:
+        self._cse_cache[key] = result
+        uses = self._cse_uses
+        for name in (result,) + operands:
+            if type(name) is str:
+                uses.setdefault(name, []).append(key)
+
+    def _cse_invalidate(self, var: str) -> None:
+        """Forget cached expressions that read or produced *var*."""
+        for key in self._cse_uses.pop(var, ()):
+            self._cse_cache.pop(key, None)
+
+    def _cse_reset(self) -> None:
+        self._cse_cache.clear()
+        self._cse_uses.clear()
+
+    def _emit_label(self, name: str) -> None:
+        # A label can be reached from elsewhere, so cached values computed
+        # on the fall-through path are not available after it
+        self.ir_code_stream.append(IRLabel(name))
+        self._cse_reset()
 
     def visit(self, node: ast.Node) -> Any:
-        method_name = f'visit_{node.__class__.__name__}'
-        visitor_method = getattr(self, method_name, self.generic_visit)
         # Expressions return a value/var_name, statements append to ir_code_stream and return None
-        return visitor_method(node)
+        return self._dispatch.get(type(node), self.generic_visit)(node)
 
     def generic_visit(self, node: ast.Node):
         raise NotImplementedError(f"No visit_{node.__class__.__name__} method for {type(node)}")
@@ -112,11 +301,11 @@ class ASTtoIRVisitor:
                 # Handle global variable declarations or other top-level statements if necessary
                 # For now, focusing on function definitions
                 print(f"Warning: Skipping top-level AST node {type(item)} in IR generation.")
-        return IRProgram(functions=ir_functions)
+        return IRProgram(functions=ir_functions, string_pool=list(self._string_pool))
 
     def visit_FuncDef(self, node: ast.FuncDef) -> IRFuncDef:
         # Save and reset state for this function
-        outer_ir_stream = self.ir_code_stream
+        self._stream_stack.append(self.ir_code_stream)
         outer_temp_count = self.temp_var_count
         outer_params = self.current_function_params
         outer_loop_stack = self.loop_stack
@@ -132,99 +321,153 @@ class ASTtoIRVisitor:
             self.current_function_params = [p[1] for p in node.params]  # Extract param names
             
         self.loop_stack = []
+        self._cse_reset()
 
         self.visit(node.body)  # Populates self.ir_code_stream
 
-        func_ir_body = self.ir_code_stream
+        func_ir_body = _peephole(self.ir_code_stream)
         func_params = list(self.current_function_params)  # Make a copy to preserve parameter list
         
         # Restore outer state
-        self.ir_code_stream = outer_ir_stream
+        self.ir_code_stream = self._stream_stack.pop()
         self.temp_var_count = outer_temp_count
         self.current_function_params = outer_params
         self.loop_stack = outer_loop_stack
         
-        return IRFuncDef(name=node.name, params=func_params, body=func_ir_body)
+        return IRFuncDef(name=node.name, params=func_params, body=func_ir_body,
+                         memoize=_is_memoizable(node, func_ir_body))
 
     def visit_Compound(self, node: ast.Compound) -> None:
+        visit = self.visit
         for stmt in node.statements:
-            self.visit(stmt) # Statements append to self.ir_code_stream
+            visit(stmt) # Statements append to self.ir_code_stream
+
+    def _visit_into(self, node: ast.Node, target: str) -> None:
+        """Evaluate *node* and store the result in program variable *target*.
+        Operations and calls write straight into *target* rather than into
+        a temp that is then copied."""
+        node_type = type(node)
+        if node_type in _RETARGETABLE and target.isidentifier():
+            value_var_or_const = self._dispatch[node_type](node, target)
+            if value_var_or_const == target:
+                return  # Already written (and the CSE cache updated) by the visitor
+        else:
+            value_var_or_const = self.visit(node)
+        self.ir_code_stream.append(IRStore(target, value_var_or_const))
+        self._cse_invalidate(target)
 
     def visit_VarDecl(self, node: ast.VarDecl) -> None:
         if node.initializer:
-            init_val_or_var = self.visit(node.initializer)
-            self.ir_code_stream.append(IRStore(target_var=node.identifier, source_var_or_const=init_val_or_var))
+            self._visit_into(node.initializer, node.identifier)
         # If no initializer, variable is declared. Some IRs might have explicit declaration.
         # For now, first store implies declaration. Or it's considered uninitialized.
 
     def visit_Assignment(self, node: ast.Assignment) -> None:
-        value_var_or_const = self.visit(node.value)
-        self.ir_code_stream.append(IRStore(target_var=node.identifier, source_var_or_const=value_var_or_const))
+        target = node.target
+        if type(target) is not ast.Identifier:
+            raise NotImplementedError(f"Assignment to {type(target).__name__} is not supported yet")
+        self._visit_into(node.value, target.name)
 
     def visit_ConstLiteral(self, node: ast.ConstLiteral) -> Any:
-        """Return the literal value directly."""
-        return node.value
+        """Return the literal value directly; strings become pool references."""
+        value = node.value
+        if type(value) is str:
+            ref = self._string_pool.get(value)
+            if ref is None:
+                ref = self._string_pool[value] = IRStringRef(len(self._string_pool))
+            return ref
+        return value
 
     def visit_Identifier(self, node: ast.Identifier) -> str:
         # When an identifier is visited in an expression context, it means its value is being used.
         # It could be a local variable, a temporary, or a function parameter.
         return node.name
 
-    def visit_BinOp(self, node: ast.BinOp) -> str: # Returns temp var name holding the result
+    def visit_BinOp(self, node: ast.BinOp, target: Optional[str] = None) -> Any: # Returns the var/temp holding the result, or the folded constant
         left_val_or_var = self.visit(node.left)
         right_val_or_var = self.visit(node.right)
-        result_temp = self._new_temp()
-        self.ir_code_stream.append(IRBinOp(target_temp_var=result_temp, op=node.op,
-                                           left_operand=left_val_or_var, right_operand=right_val_or_var))
+        folded = fold_binop(node.op, left_val_or_var, right_val_or_var)
+        if folded is not None:
+            return folded
+        # Operand types are part of the key so that 1, 1.0 and True stay distinct
+        key = (node.op, type(left_val_or_var), left_val_or_var, type(right_val_or_var), right_val_or_var)
+        result_temp = self._cse_cache.get(key)
+        if result_temp is not None:
+            return result_temp
+        operands = (left_val_or_var, right_val_or_var)
+        if target is None:
+            result_temp = self._new_temp()
+        else:
+            result_temp = target
+        self.ir_code_stream.append(IRBinOp(result_temp, node.op, left_val_or_var, right_val_or_var))
+        if target is not None:
+            self._cse_invalidate(target)
+            if target in operands:
+                return result_temp  # e.g. x = x + 1: the key no longer describes x
+        self._cse_remember(key, result_temp, operands)
         return result_temp
 
-    def visit_UnaryOp(self, node: ast.UnaryOp) -> str: # Returns temp var name holding the result
+    def visit_UnaryOp(self, node: ast.UnaryOp, target: Optional[str] = None) -> Any: # Returns the var/temp holding the result, or the folded constant
         operand_val_or_var = self.visit(node.operand)
-        result_temp = self._new_temp()
-        self.ir_code_stream.append(IRUnaryOp(target_temp_var=result_temp, op=node.op, operand=operand_val_or_var))
+        folded = fold_unaryop(node.op, operand_val_or_var)
+        if folded is not None:
+            return folded
+        key = (node.op, type(operand_val_or_var), operand_val_or_var)
+        result_temp = self._cse_cache.get(key)
+        if result_temp is not None:
+            return result_temp
+        if target is None:
+            result_temp = self._new_temp()
+        else:
+            result_temp = target
+        self.ir_code_stream.append(IRUnaryOp(result_temp, node.op, operand_val_or_var))
+        if target is not None:
+            self._cse_invalidate(target)
+            if target == operand_val_or_var:
+                return result_temp
+        self._cse_remember(key, result_temp, (operand_val_or_var,))
         return result_temp
 
     def visit_IfStmt(self, node: ast.IfStmt) -> None:
+        emit = self.ir_code_stream.append  # the stream is not rebound while a statement is visited
         cond_var = self.visit(node.test) # Should return var name holding boolean result
 
-        then_label = self._new_label("then")
         else_label = self._new_label("else")
         end_if_label = self._new_label("endif")
 
+        # The then-branch is the fall-through path; only the false case jumps
         actual_false_label = else_label if node.alternate else end_if_label
-        self.ir_code_stream.append(IRConditionalGoto(condition_var=cond_var, true_label=then_label, false_label=actual_false_label))
+        emit(IRCondJumpIfFalse(cond_var, actual_false_label))
 
-        self.ir_code_stream.append(IRLabel(name=then_label))
         self.visit(node.consequent)
 
         if node.alternate:
-            self.ir_code_stream.append(IRGoto(label=end_if_label)) # Skip else block if then was executed
-            self.ir_code_stream.append(IRLabel(name=else_label))
+            emit(IRGoto(end_if_label)) # Skip else block if then was executed
+            self._emit_label(else_label)
             self.visit(node.alternate)
 
-        self.ir_code_stream.append(IRLabel(name=end_if_label))
+        self._emit_label(end_if_label)
 
     def visit_WhileStmt(self, node: ast.WhileStmt) -> None:
+        emit = self.ir_code_stream.append
         loop_cond_label = self._new_label("while_cond")
-        loop_body_label = self._new_label("while_body")
         loop_end_label = self._new_label("while_end")
 
         self.loop_stack.append((loop_cond_label, loop_end_label)) # Continue goes to cond, Break goes to end
 
-        self.ir_code_stream.append(IRLabel(name=loop_cond_label))
+        self._emit_label(loop_cond_label)
         cond_var = self.visit(node.test)
-        self.ir_code_stream.append(IRConditionalGoto(condition_var=cond_var, true_label=loop_body_label, false_label=loop_end_label))
+        emit(IRCondJumpIfFalse(cond_var, loop_end_label))
 
-        self.ir_code_stream.append(IRLabel(name=loop_body_label))
         self.visit(node.body)
-        self.ir_code_stream.append(IRGoto(label=loop_cond_label)) # Jump back to condition check
+        emit(IRGoto(loop_cond_label)) # Jump back to condition check
 
-        self.ir_code_stream.append(IRLabel(name=loop_end_label))
+        self._emit_label(loop_end_label)
         self.loop_stack.pop()
 
     def visit_ForStmt(self, node: ast.ForStmt) -> None:
+        emit = self.ir_code_stream.append
         loop_cond_label = self._new_label("for_cond")
-        loop_body_label = self._new_label("for_body")
         loop_update_label = self._new_label("for_update")
         loop_end_label = self._new_label("for_end")
 
@@ -233,54 +476,56 @@ class ASTtoIRVisitor:
         if node.init:
             self.visit(node.init) # Init is a statement (VarDecl or Assignment or expr)
 
-        self.ir_code_stream.append(IRLabel(name=loop_cond_label))
-        if node.test:
+        self._emit_label(loop_cond_label)
+        if node.test: # No test means infinite loop (unless break)
             test_cond_var = self.visit(node.test)
-            self.ir_code_stream.append(IRConditionalGoto(condition_var=test_cond_var, true_label=loop_body_label, false_label=loop_end_label))
-        else: # No test means infinite loop (unless break)
-            self.ir_code_stream.append(IRGoto(label=loop_body_label))
+            emit(IRCondJumpIfFalse(test_cond_var, loop_end_label))
 
-        self.ir_code_stream.append(IRLabel(name=loop_body_label))
         self.visit(node.body)
 
-        self.ir_code_stream.append(IRLabel(name=loop_update_label))
+        self._emit_label(loop_update_label)
         if node.update:
             self.visit(node.update) # Update is a statement
 
-        self.ir_code_stream.append(IRGoto(label=loop_cond_label))
-        self.ir_code_stream.append(IRLabel(name=loop_end_label))
+        emit(IRGoto(loop_cond_label))
+        self._emit_label(loop_end_label)
         self.loop_stack.pop()
 
-    def visit_FuncCall(self, node: ast.FuncCall) -> str:
+    def visit_FuncCall(self, node: ast.FuncCall, target: Optional[str] = None) -> str:
         """Visit function call node and generate IR instructions."""
         arg_vars_or_consts = []
         for arg in node.args:
             arg_vars_or_consts.append(self.visit(arg))
         
         # Determine if the function call's result is used.
-        # For simplicity, always assign to a temp. Can be optimized later.
-        result_temp = self._new_temp()
-        self.ir_code_stream.append(IRCall(func_name=node.name, args=arg_vars_or_consts, target_temp_var=result_temp))
+        # For simplicity, assign to a temp unless the caller names a variable.
+        if target is None:
+            result_temp = self._new_temp()
+        else:
+            result_temp = target
+        self.ir_code_stream.append(IRCall(node.name, arg_vars_or_consts, result_temp))
+        if target is not None:
+            self._cse_invalidate(target)
         return result_temp
 
     def visit_ReturnStmt(self, node: ast.ReturnStmt) -> None:
         val_or_var = None
         if node.value:
             val_or_var = self.visit(node.value)
-        self.ir_code_stream.append(IRReturn(value_var_or_const=val_or_var))
+        self.ir_code_stream.append(IRReturn(val_or_var))
 
     def visit_BreakStmt(self, node: ast.BreakStmt) -> None:
         if not self.loop_stack:
             # This should ideally be caught by a semantic analysis phase or parser
             raise ValueError("Break statement outside of loop.")
         _ , break_label = self.loop_stack[-1]
-        self.ir_code_stream.append(IRGoto(label=break_label))
+        self.ir_code_stream.append(IRGoto(break_label))
 
     def visit_ContinueStmt(self, node: ast.ContinueStmt) -> None:
         if not self.loop_stack:
             raise ValueError("Continue statement outside of loop.")
         continue_label, _ = self.loop_stack[-1]
-        self.ir_code_stream.append(IRGoto(label=continue_label))
+        self.ir_code_stream.append(IRGoto(continue_label))
 
     def visit_TryStmt(self, node: ast.TryStmt) -> None:
         # Create labels for try entry, catch handler, and after the whole try-catch
@@ -289,25 +534,26 @@ class ASTtoIRVisitor:
         end_label = self._new_label("try_end")
         
         # Save current code stream to restore after processing both bodies
-        outer_ir_stream = self.ir_code_stream
+        self._stream_stack.append(self.ir_code_stream)
         
-        # Process try block
-        try_body_stream = []
-        self.ir_code_stream = try_body_stream
+        # Process try block. The catch body may start from any point of it, and
+        # the code after the statement from either body, so no CSE entry
+        # carries across these boundaries
+        try_body = self.ir_code_stream = []
+        self._cse_reset()
         self.visit(node.body)
-        try_body = self.ir_code_stream
         
         # Process catch block
-        catch_body_stream = []
-        self.ir_code_stream = catch_body_stream
+        catch_body = self.ir_code_stream = []
+        self._cse_reset()
         # For each catch handler (we only support one for now)
         handler = node.handlers[0]  # Just handle the first one for simplicity
         catch_var = handler.param_name
         self.visit(handler.body)
-        catch_body = self.ir_code_stream
         
         # Restore outer stream
-        self.ir_code_stream = outer_ir_stream
+        self.ir_code_stream = self._stream_stack.pop()
+        self._cse_reset()
         
         # Emit try-catch block instructions
         self.ir_code_stream.append(IRTryCatch(
@@ -13,9 +13,13 @@ Usage
 """
 from __future__ import annotations
 import re, sys
+from array import array
 from typing import List, Iterator, Optional, Any
 
 class Token:
+    # "lexer" and "lineno" are attached by PLY during error recovery.
+    __slots__ = ("type", "value", "line", "column", "lexpos", "lexer", "lineno")
+
     def __init__(self, type: str, value: Any, line: int, column: int, lexpos: int):
         self.type = type
         self.value = value
@@ -98,6 +102,12 @@ _LITERAL_KEYWORDS_MAP = {
     "machibssa7": ("BOOL", False),
     "walou": ("NULL", "walou"),
 }
+
+# Single lookup table for every reserved word: lexeme -> (token type, value).
+_KEYWORD_TABLE = {kw: ("TYPE", kw) for kw in _TYPE_KEYWORDS}
+_KEYWORD_TABLE.update((kw, (tok_type, kw)) for kw, tok_type in _CONTROL_KEYWORDS_MAP.items())
+_KEYWORD_TABLE.update(_LITERAL_KEYWORDS_MAP)
+
 _SYMBOLS_MAP = {
     '(': 'LPAREN', ')': 'RPAREN', '{': 'LBRACE', '}': 'RBRACE',
     '[': 'LBRACKET', ']': 'RBRACKET', ',': 'COMMA', ';': 'SEMI',
@@ -105,250 +115,251 @@ _SYMBOLS_MAP = {
     '+': 'PLUS', '-': 'MINUS', '*': 'TIMES', '/': 'DIVIDE',
 }
 
-# Add special handling for Arabic-numeral-containing keywords
-_SPECIAL_KEYWORDS = {
-    "7awl": "TRY",       # Try block
-    "3ajib": "EXCEPTION"  # Exception type
+# Operator lexemes -> token type. '&&' and '||' are still accepted as symbols;
+# the "ou"/"machi" keywords are the main spelling.
+_OP2_MAP = {
+    '<=': 'LE', '>=': 'GE', '==': 'EQ', '!=': 'NE',
+    '&&': 'OU', '||': 'AWLA_LOGICAL',
 }
+_OP1_MAP = dict(_SYMBOLS_MAP, **{'!': 'MACHI', '<': 'LT', '>': 'GT'})
+
+# Keywords spelled with a leading digit (7awl, 3ajib). They are matched as a
+# whole word ahead of NUMBER and then classified through _KEYWORD_TABLE.
+_DIGIT_KEYWORDS_RE = "|".join(sorted((kw for kw in _KEYWORD_TABLE if kw[0].isdigit()), key=len, reverse=True))
 
 # Regex patterns --------------------------------------------------------------
-TAG_RE      = re.compile(r"<[^>]+>")                             # HTML‑style tag
+# One alternation tried at each position; the group order is the order the
+# cases are tried in (tags before '<' operators, '//' before '/', digit-led
+# keywords before numbers). String literals are scanned by hand from QUOTE.
+_MASTER_RE = re.compile(r"""
+     (?P<WS>[ \t\r]+)
+    |(?P<NL>\n)
+    |(?P<COMMENT>//[^\n]*)
+    |(?P<TAG><[^>]+>)                    # HTML‑style tag
+    |(?P<OP2><=|>=|==|!=|&&|\|\|)
+    |(?P<OP1>[(){}\[\],;.:=+\-*/!<>])
+    |(?P<QUOTE>")
+    |(?P<ID>(?:%s)(?![A-Za-z_])|[A-Za-z_]\w*)
+    |(?P<NUMBER>\d+(?:\.\d+)?)
+""" % _DIGIT_KEYWORDS_RE, re.VERBOSE)
 # ESC_STRING  = re.compile(r'"((?:\\.|[^"\\])*)"')               # Old regex, kept for reference
-NUMBER_RE   = re.compile(r"\d+(?:\.\d+)?")
-ID_RE       = re.compile(r"[A-Za-z_][\w]*")
-SPECIAL_ID_RE = re.compile(r"[0-9][A-Za-z_]+")  # For identifiers starting with numbers
-WHITESPACE  = re.compile(r"[ \t\r]+")
-COMMENT_RE  = re.compile(r"//[^\n]*")
+
+# Escape sequences decoded inside string literals. The value holds the
+# real characters; the C emitter escapes them again for the generated code.
+_STRING_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '0': '\0', '"': '"', '\\': '\\'}
 
 # ─── Core lexer ─────────────────────────────────────────────────────────────
 
-def tokenize(code: str) -> Iterator[Token]:
+def _scan(code: str) -> Iterator[tuple]:
+    """Yield (type, value, line, column, lexpos) tuples for *code*."""
     line = 1
     col0 = 0  # index of line start in code
     i = 0
     n = len(code)
 
-    def column(pos: int) -> int:
-        return pos - col0 + 1
-
+    match = _MASTER_RE.match
     while i < n:
-        char_i = code[i]
+        m = match(code, i)
+        if m is None:
+            break  # Unexpected character, reported below
+        kind = m.lastgroup
 
-        # Handle newlines fast
-        if char_i == "\n":
-            line += 1
-            i += 1
-            col0 = i
-            continue
-
-        # Skip whitespace
-        m = WHITESPACE.match(code, i)
-        if m:
+        if kind == "WS" or kind == "COMMENT" or kind == "TAG":
             i = m.end()
             continue
 
-        # Skip comments
-        m = COMMENT_RE.match(code, i)
-        if m:
+        if kind == "ID":
+            lexeme = m.group()
+            kw = _KEYWORD_TABLE.get(lexeme)
+            if kw is None:
+                yield ("ID", lexeme, line, i - col0 + 1, i)
+            else:
+                yield (kw[0], kw[1], line, i - col0 + 1, i)
             i = m.end()
             continue
 
-        # Skip HTML‑style tags <...>
-        if char_i == "<":
-            tag_match = TAG_RE.match(code, i)
-            if tag_match:
-                i = tag_match.end()
-                continue
-
-        # Check for multi-character operators first (logical and relational)
-        # Relational
-        if code[i:i+2] == '<=':
-            yield Token('LE', '<=', line, column(i), i)
-            i += 2
-            continue
-        if code[i:i+2] == '>=':
-            yield Token('GE', '>=', line, column(i), i)
-            i += 2
-            continue
-        if code[i:i+2] == '==':
-            yield Token('EQ', '==', line, column(i), i)
-            i += 2
-            continue
-        if code[i:i+2] == '!=':
-            yield Token('NE', '!=', line, column(i), i)
-            i += 2
-            continue
-        # Logical Symbols (still support && and || if desired, keywords will take precedence for "ou", "machi")
-        if code[i:i+2] == '&&':
-            yield Token('OU', '&&', line, column(i), i) # Symbol for AND
-            i += 2
-            continue
-        if code[i:i+2] == '||':
-            yield Token('AWLA_LOGICAL', '||', line, column(i), i) # Symbol for OR
-            i += 2
-            continue
-        
-        # Check for single-character operators (logical NOT symbol)
-        # Note: 'machi' keyword for NOT is handled by _CONTROL_KEYWORDS_MAP
-        if char_i == '!': # Symbol for NOT
-            yield Token('MACHI', '!', line, column(i), i)
+        if kind == "OP1":
+            op_val = m.group()
+            yield (_OP1_MAP[op_val], op_val, line, i - col0 + 1, i)
             i += 1
             continue
-        if char_i == '<':
-            yield Token('LT', '<', line, column(i), i)
+
+        if kind == "NL":
+            line += 1
             i += 1
+            col0 = i
             continue
-        if char_i == '>':
-            yield Token('GT', '>', line, column(i), i)
-            i += 1
+
+        if kind == "OP2":
+            op_val = m.group()
+            yield (_OP2_MAP[op_val], op_val, line, i - col0 + 1, i)
+            i += 2
             continue
 
-        # Single-character symbols
-        if char_i in _SYMBOLS_MAP:
-            op_val = char_i
-            op_type = _SYMBOLS_MAP[op_val]
-            yield Token(op_type, op_val, line, column(i), i)
-            i += 1
+        # Number literal
+        if kind == "NUMBER":
+            num_str = m.group()
+            try:
+                val = int(num_str) if '.' not in num_str else float(num_str)
+            except ValueError:
+                val = num_str
+            yield ("NUMBER", val, line, i - col0 + 1, i)
+            i = m.end()
             continue
 
         # String literal - Manual parsing logic
-        if char_i == '"':
+        if kind == "QUOTE":
+            # Fast path: no escapes or newlines before the closing quote, so
+            # the literal's value is a single slice of the source
+            end = code.find('"', i + 1)
+            if end != -1:
+                body = code[i + 1:end]
+                if '\\' not in body and '\n' not in body:
+                    yield ("STRING", body, line, i - col0 + 1, i)
+                    i = end + 1
+                    continue
+
             start_pos = i
             start_line = line
-            start_col = column(i)
+            start_col = i - col0 + 1
             
             i += 1 # Move past the opening quote
             str_content_chars = []
-            # print(f"DEBUG: Entered string parsing at line {start_line}, col {start_col}") # Optional: debug entry
+            # Jump between the characters that need handling ('"', '\\', '\n')
+            # with str.find and copy the runs in between as single slices
+            next_quote = code.find('"', i)
+            next_esc = code.find('\\', i)
+            next_nl = code.find('\n', i)
             
-            while i < n:
-                current_char_in_string = code[i]
-                # print(f"DEBUG: String char: {current_char_in_string!r}, i={i}, line={line}") # DEBUG PRINT
+            while next_quote != -1:
+                j = next_quote
+                if next_esc != -1 and next_esc < j:
+                    j = next_esc
+                if next_nl != -1 and next_nl < j:
+                    j = next_nl
+                if j > i:
+                    str_content_chars.append(code[i:j])
+                current_char_in_string = code[j]
                 
                 if current_char_in_string == '"': # Closing quote
-                    i += 1 # Move past the closing quote
-                    # print(f"DEBUG: Found closing quote. Content: {''.join(str_content_chars)}") # Optional: debug exit
-                    yield Token("STRING", "".join(str_content_chars), start_line, start_col, start_pos)
+                    i = j + 1 # Move past the closing quote
+                    yield ("STRING", "".join(str_content_chars), start_line, start_col, start_pos)
                     break # String tokenized successfully
                 elif current_char_in_string == '\\': # Escape sequence
-                    i += 1 # Move past backslash
-                    if i < n:
-                        escaped_char = code[i]
-                        if escaped_char == 'n':
-                            str_content_chars.append('\n')
-                        elif escaped_char == '"':
-                            str_content_chars.append('"')
-                        elif escaped_char == '\\':
-                            str_content_chars.append('\\')
-                        # Add other common escapes if needed, e.g., \t for tab
-                        else:
-                            # If not a recognized escape, treat as literal backslash followed by the character
-                            str_content_chars.append('\\')
-                            str_content_chars.append(escaped_char) 
-                        i += 1 # Move past the escaped character
-                    else: # EOF after backslash - unterminated string
-                        break # Break to outer loop's EOF check for unterminated string
-                elif current_char_in_string == '\n':
+                    # A closing quote exists after j, so the escaped character does too
+                    escaped_char = code[j + 1]
+                    decoded = _STRING_ESCAPES.get(escaped_char)
+                    if decoded is not None:
+                        str_content_chars.append(decoded)
+                    else:
+                        # If not a recognized escape, treat as literal backslash followed by the character
+                        str_content_chars.append('\\')
+                        str_content_chars.append(escaped_char)
+                    i = j + 2 # Move past the escaped character
+                    next_esc = code.find('\\', i)
+                    if next_quote < i:
+                        next_quote = code.find('"', i)
+                    if next_nl != -1 and next_nl < i:
+                        next_nl = code.find('\n', i)
+                else:
                     # Handling of unescaped newlines in strings:
                     # Option 1: Disallow (raise error)
                     # Option 2: Allow (as done here, for simplicity or multiline strings)
-                    str_content_chars.append(current_char_in_string)
+                    str_content_chars.append('\n')
                     line += 1
-                    col0 = i + 1
-                    i += 1
-                else: # Regular character in string (like a period)
-                    # print(f"DEBUG: Appending regular char: {current_char_in_string!r}") # Optional: debug append
-                    str_content_chars.append(current_char_in_string)
-                    i += 1
-            else: # Outer while loop finished because i >= n (EOF)
-                if start_pos < n and code[start_pos] == '"': # Check if we actually started parsing a string
-                    # This means an unterminated string literal
-                    context_char_at_start = code[start_pos]
-                    error_message_unterminated = (
-                        f"Unterminated string literal starting at line {start_line} col {start_col} (pos {start_pos}).\n"
-                        f"String began with: {context_char_at_start}"
-                    )
-                    raise SyntaxError(error_message_unterminated)
+                    i = col0 = j + 1
+                    next_nl = code.find('\n', i)
+            else: # No closing quote before EOF - unterminated string literal
+                error_message_unterminated = (
+                    f"Unterminated string literal starting at line {start_line} col {start_col} (pos {start_pos}).\n"
+                    f"String began with: {code[start_pos]}"
+                )
+                raise SyntaxError(error_message_unterminated)
             continue # Continue to the next tokenization attempt from the main loop
 
-        # Check for special keywords that start with numbers (like 7awl, 3ajib)
-        if char_i.isdigit():
-            m = SPECIAL_ID_RE.match(code, i)
-            if m:
-                lexeme = m.group(0)
-                tok_line = line
-                tok_col = column(i)
-                tok_lexpos = i
-                i = m.end()
-                
-                # Check if it's a special keyword
-                if lexeme in _SPECIAL_KEYWORDS:
-                    yield Token(_SPECIAL_KEYWORDS[lexeme], lexeme, tok_line, tok_col, tok_lexpos)
-                    continue
-                # If not a special keyword, fall through to number handling
-
-        # Number literal
-        m = NUMBER_RE.match(code, i)
-        if m:
-            num_str = m.group(0)
-            try:
-                val = int(num_str) if '.' not in num_str else float(num_str)
-            except ValueError:
-                val = num_str
-            yield Token("NUMBER", val, line, column(i), i)
-            i = m.end()
-            continue
-
-        # Identifier / keyword
-        m = ID_RE.match(code, i)
-        if m:
-            lexeme = m.group(0)
-            tok_line = line
-            tok_col = column(i)
-            tok_lexpos = i
-            i = m.end()
-
-            if lexeme in _TYPE_KEYWORDS:
-                yield Token("TYPE", lexeme, tok_line, tok_col, tok_lexpos)
-            elif lexeme in _CONTROL_KEYWORDS_MAP:
-                yield Token(_CONTROL_KEYWORDS_MAP[lexeme], lexeme, tok_line, tok_col, tok_lexpos)
-            elif lexeme in _LITERAL_KEYWORDS_MAP:
-                tok_type, tok_val = _LITERAL_KEYWORDS_MAP[lexeme]
-                yield Token(tok_type, tok_val, tok_line, tok_col, tok_lexpos)
-            else:
-                yield Token("ID", lexeme, tok_line, tok_col, tok_lexpos)
-            continue
-
+    if i < n:
         # If nothing matched
         # More detailed error context:
         context_before = code[max(0, i-30):i]
         context_after = code[i+1:i+31]
         error_message = (
-            f"Unexpected character {code[i]!r} at line {line} col {column(i)} (pos {i}).\n"
+            f"Unexpected character {code[i]!r} at line {line} col {i - col0 + 1} (pos {i}).\n"
             f"Context: ...'{context_before}' [ERROR_CHAR:'{code[i]}'] '{context_after}'..."
         )
         raise SyntaxError(error_message)
 
+def tokenize(code: str) -> Iterator[Token]:
+    for tok in _scan(code):
+        yield Token(*tok)
+
+class TokenStream:
+    """Columnar token buffer: one list/array per Token field.
+
+    Token types are the shared string constants from the tables above, so
+    the types column only holds references to a few dozen strings. Token
+    objects are built on demand by :meth:`token`.
+    """
+    __slots__ = ("types", "values", "lines", "columns", "lexposes")
+
+    def __init__(self, code: str):
+        self.types: List[str] = []
+        self.values: List[Any] = []
+        self.lines = array("i")
+        self.columns = array("i")
+        self.lexposes = array("i")
+        types_append = self.types.append
+        values_append = self.values.append
+        lines_append = self.lines.append
+        columns_append = self.columns.append
+        lexposes_append = self.lexposes.append
+        for tok_type, value, line, col, pos in _scan(code):
+            types_append(tok_type)
+            values_append(value)
+            lines_append(line)
+            columns_append(col)
+            lexposes_append(pos)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def token(self, idx: int) -> Token:
+        return Token(self.types[idx], self.values[idx], self.lines[idx],
+                     self.columns[idx], self.lexposes[idx])
+
+def _normalize_source(data: str) -> str:
+    """Turn the <br> line breaks some sources are saved with into newlines.
+    The substring test avoids copying sources that contain none."""
+    if "<br>" in data:
+        data = data.replace("<br>", "\n")
+    return data
+
 # ─── PLY Lexer Wrapper ───────────────────────────────────────────────────────
 
 class LexerWrapper:
-    def __init__(self, tokenizer_func):
-        self.tokenizer_func = tokenizer_func
-        self.token_stream = iter([])
+    def __init__(self, stream_factory=TokenStream):
+        self.stream_factory = stream_factory
+        self.token_stream: Optional[TokenStream] = None
+        self._pos = 0
         self._lineno = 1
 
     def input(self, data: str):
-        processed_data = data.replace("<br>", "\n")
-        self.token_stream = self.tokenizer_func(processed_data)
+        processed_data = _normalize_source(data)
+        self.token_stream = self.stream_factory(processed_data)
+        self._pos = 0
         self._lineno = 1
 
     def token(self) -> Optional[Token]:
-        try:
-            tok = next(self.token_stream)
-            self._lineno = tok.line
-            return tok
-        except StopIteration:
+        stream = self.token_stream
+        pos = self._pos
+        if stream is None or pos >= len(stream.types):
             return None
+        self._pos = pos + 1
+        self._lineno = stream.lines[pos]
+        return stream.token(pos)
+
+    def clone(self) -> "LexerWrapper":
+        """Return a new wrapper with the same stream factory and no input."""
+        return LexerWrapper(self.stream_factory)
 
     @property
     def lineno(self):
@@ -359,7 +370,7 @@ class LexerWrapper:
         self._lineno = value
 
 # Instantiate the lexer for PLY parser to use via "lexmod.lexer"
-lexer = LexerWrapper(tokenize)
+lexer = LexerWrapper()
 
 # ─── CLI helper ──────────────────────────────────────────────────────────────
 
@@ -367,16 +378,14 @@ def _read_source(path: Optional[str]) -> str:
     if path:
         try:
             with open(path, "r", encoding="utf‑8") as f:
-                content = f.read()
-                content = content.replace("<br>", "\n")
-                return content
+                return f.read()
         except FileNotFoundError:
             print(f"⚠️  File not found: {path}\nSwitching to interactive mode. Paste code then Ctrl‑D / Ctrl‑Z.\n", file=sys.stderr)
     print(">>> DarijaLang interactive input <<<", file=sys.stderr)
     return sys.stdin.read()
 
 def main(argv: List[str]) -> None:
-    src = _read_source(argv[1] if len(argv) > 1 else None)
+    src = _normalize_source(_read_source(argv[1] if len(argv) > 1 else None))
     try:
         for tok in tokenize(src):
             print(tok)
@@ -9,7 +9,7 @@ into an Abstract Syntax Tree (AST).
 
 ▸ Design notes
   • The lexer from darija_lexer.py is imported and reused.
-  • The AST is represented with simple @dataclass nodes for clarity.
+  • The AST is represented with simple slotted @dataclass nodes for clarity.
   • Only a minimal C‑like subset is implemented: variable declarations,
     assignments, arithmetic expressions, function definitions, if/else,
     while, for, break/continue, return, and I/O calls.
@@ -20,6 +20,9 @@ features (arrays, structs, etc.).
 """
 from __future__ import annotations
 
+import functools
+import os
+import sys
 import ply.yacc as yacc
 from dataclasses import dataclass, field
 from typing import List, Any
@@ -28,140 +31,143 @@ from typing import List, Any
 # 1.  Re‑use lexer tokens
 # ──────────────────────────────────────────────────────────────────────
 import darija_lexer as lexmod
+from darija_cache import cache_dir
+from darija_fold import ARITH_OPS, fold_binop, fold_unaryop
 
 tokens = lexmod.tokens
+_TOKEN_SET = frozenset(tokens)
 
 # ──────────────────────────────────────────────────────────────────────
 # 2.  AST Node definitions
 # ──────────────────────────────────────────────────────────────────────
-@dataclass
+@dataclass(slots=True)
 class Node:
     line: int
 
-@dataclass
+@dataclass(slots=True)
 class Program(Node):
     body: List[Node]
 
-@dataclass
+@dataclass(slots=True)
 class VarDecl(Node):
     type_name: str
     identifier: str
     initializer: Any | None
 
-@dataclass
+@dataclass(slots=True)
 class ConstLiteral(Node):
     value: Any
 
-@dataclass
+@dataclass(slots=True)
 class Identifier(Node):
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class BinOp(Node):
     op: str
     left: Node
     right: Node
 
-@dataclass
+@dataclass(slots=True)
 class UnaryOp(Node):
     op: str
     operand: Node
 
-@dataclass
+@dataclass(slots=True)
 class Assignment(Node):
-    identifier: str
+    target: Node  # Identifier or ArrayAccess
     value: Node
 
-@dataclass
+@dataclass(slots=True)
 class IfStmt(Node):
     test: Node
     consequent: Node
     alternate: Node | None
 
-@dataclass
+@dataclass(slots=True)
 class WhileStmt(Node):
     test: Node
     body: Node
 
-@dataclass
+@dataclass(slots=True)
 class ForStmt(Node):
     init: Node | None
     test: Node | None
     update: Node | None
     body: Node
 
-@dataclass
+@dataclass(slots=True)
 class BreakStmt(Node):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class ContinueStmt(Node):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStmt(Node):
     value: Node | None
 
-@dataclass
+@dataclass(slots=True)
 class Compound(Node):
     statements: List[Node]
 
-@dataclass
+@dataclass(slots=True)
 class FuncCall(Node):
     name: str
     args: List[Node]
 
-@dataclass
+@dataclass(slots=True)
 class FuncDef(Node):
     return_type: str
     name: str
     params: List[tuple]
     body: Compound
 
-@dataclass
+@dataclass(slots=True)
 class ArrayExpr(Node):
     elements: List[Node]
 
-@dataclass
+@dataclass(slots=True)
 class ArrayAccess(Node):
     array: Node
     index: Node
 
-@dataclass
+@dataclass(slots=True)
 class DictExpr(Node):
     keys: List[Node]
     values: List[Node]
 
-@dataclass
+@dataclass(slots=True)
 class DictAccess(Node):
     dict_expr: Node
     key: Node
 
-@dataclass
+@dataclass(slots=True)
 class ClassDef(Node):
     name: str
     parent: str | None
     body: List[Node]
 
-@dataclass
+@dataclass(slots=True)
 class MemberAccess(Node):
     object: Node
     member: str
 
-@dataclass
+@dataclass(slots=True)
 class MethodCall(Node):
     object: Node
     method: str
     args: List[Node]
 
-@dataclass
+@dataclass(slots=True)
 class Property(Node):
     type_name: str
     name: str
     access: str  # 'public' or 'private'
     initializer: Any | None
 
-@dataclass
+@dataclass(slots=True)
 class Method(Node):
     return_type: str
     name: str
@@ -169,18 +175,18 @@ class Method(Node):
     body: Compound
     access: str  # 'public' or 'private'
 
-@dataclass
+@dataclass(slots=True)
 class TryStmt(Node):
     body: Compound
     handlers: List[CatchClause]
 
-@dataclass
+@dataclass(slots=True)
 class CatchClause(Node):
     param_type: str
     param_name: str
     body: Compound
 
-@dataclass
+@dataclass(slots=True)
 class ThrowStmt(Node):
     expression: Node
 
@@ -194,29 +200,45 @@ precedence = (
     ('left', 'LT', 'LE', 'GT', 'GE'), # Relational operators (<, <=, >, >=)
     ("left", "PLUS", "MINUS"),
     ("left", "TIMES", "DIVIDE"),
-    ("right", "UMINUS"),           # Unary minus
-    ("right", "MACHI"),            # Logical NOT (!)
-    ('nonassoc', 'ILA_IFX'),       # For if-then (dangling if) - lower precedence
-    ('nonassoc', 'AWLA'),          # For if-else: AWLA token itself - higher precedence
+    ("right", "UMINUS", "MACHI"),  # Unary minus and logical NOT (!)
     ("left", "DOT"),               # Member access has high precedence
 )
 
+# Names and operators are interned as the AST is built, so every
+# occurrence of the same identifier or operator shares one str object.
+_intern = sys.intern
+
+# Integer arithmetic on two literals is folded as the expression is reduced,
+# with the C int semantics of darija_fold; everything else is left to the
+# IR's folding.
+
+# The busiest actions below read and write ``p.slice`` entries directly:
+# ``p[n]`` goes through YaccProduction.__getitem__, a Python-level call,
+# while ``p.slice[n].value`` is a plain list index and attribute fetch.
+
 # ──────────────────────────────────────────────────────────────────────
 # 4.  Grammar rules (p_*)
 # ──────────────────────────────────────────────────────────────────────
 
+def _ln(p, i=1):
+    """Source line of the i-th symbol of the production (a token)."""
+    return p.slice[i].line
+
 def p_program(p):
     """program : external_list"""
     p[0] = Program(body=p[1], line=1)
 
 
 def p_external_list(p):
-    """external_list : external external_list
+    """external_list : external_list external
                      | empty"""
-    if len(p) == 3:
-        p[0] = [p[1]] + p[2]
+    sl = p.slice
+    if len(sl) == 3:
+        body = sl[1].value
+        body.append(sl[2].value)
+        sl[0].value = body
     else: # empty
-        p[0] = []
+        sl[0].value = []
 
 
 def p_external(p):
@@ -228,58 +250,73 @@ def p_external(p):
 # Function definition
 def p_function_def(p):
     """function_def : TYPE ID LPAREN param_list RPAREN compound"""
-    p[0] = FuncDef(return_type=p[1], name=p[2], params=p[4], body=p[6], line=p.slice[1].line)
+    p[0] = FuncDef(return_type=p[1], name=p[2], params=p[4], body=p[6], line=_ln(p))
 
+# Empty alternatives are written inline so a missing list costs no extra
+# reduction through `empty`.
 def p_param_list(p):
     """param_list : param_list_nonempty
-                  | empty"""
-    p[0] = p[1]
+                  | """
+    p[0] = p[1] if len(p) == 2 else None
 
 def p_param_list_nonempty(p):
     """param_list_nonempty : TYPE ID
-                            | TYPE ID COMMA param_list_nonempty"""
+                            | param_list_nonempty COMMA TYPE ID"""
     if len(p) == 3:
         p[0] = [(p[1], p[2])]
     else:
-        p[0] = [(p[1], p[2])] + p[4]
+        p[0] = p[1]
+        p[0].append((p[3], p[4]))
 
 # Function call and argument list rules
 def p_func_call(p):
     """func_call : ID LPAREN arg_list RPAREN"""
-    p[0] = FuncCall(name=p[1], args=p[3], line=p.slice[1].line)
+    p[0] = FuncCall(name=_intern(p[1]), args=p[3], line=_ln(p))
 
 def p_arg_list(p):
     """arg_list : arg_list_nonempty
-                | empty"""
-    if p[1] is None:  # empty case
-        p[0] = []
-    else:  # non-empty case
-        p[0] = p[1]
+                | """
+    p[0] = p[1] if len(p) == 2 else []
 
 def p_arg_list_nonempty(p):
     """arg_list_nonempty : expression
-                          | expression COMMA arg_list_nonempty"""
-    if len(p) == 2:
-        p[0] = [p[1]]
+                          | arg_list_nonempty COMMA expression"""
+    sl = p.slice
+    if len(sl) == 2:
+        sl[0].value = [sl[1].value]
     else:
-        p[0] = [p[1]] + p[3]
+        args = sl[1].value
+        args.append(sl[3].value)
+        sl[0].value = args
 
 # Compound block
 def p_compound(p):
     """compound : LBRACE stmt_list RBRACE"""
-    p[0] = Compound(statements=p[2], line=p.slice[1].line)
+    p[0] = Compound(statements=p[2], line=_ln(p))
 
 # Fix the statement list handling to be more robust
 def p_stmt_list(p):
-    """stmt_list : statement stmt_list
+    """stmt_list : stmt_list_nonempty
                  | empty"""
-    if len(p) == 3:
-        if p[2] is None:
-            p[0] = [p[1]]  # Single statement case
-        else:
-            p[0] = [p[1]] + p[2]  # Multiple statements case
-    else:
+    if p[1] is None:
         p[0] = []  # Empty case
+    else:
+        p[0] = p[1]
+
+# Left-recursive so a block of statements is appended to one list; the
+# empty alternative stays on stmt_list because an empty reduction at the
+# front of a left-recursive list would have to be chosen before '{' can
+# be told apart from a dict literal.
+def p_stmt_list_nonempty(p):
+    """stmt_list_nonempty : statement
+                          | stmt_list_nonempty statement"""
+    sl = p.slice
+    if len(sl) == 2:
+        sl[0].value = [sl[1].value]
+    else:
+        stmts = sl[1].value
+        stmts.append(sl[2].value)
+        sl[0].value = stmts
 
 # Statements umbrella
 def p_statement(p):
@@ -301,16 +338,15 @@ def p_declaration_stmt(p):
     """declaration_stmt : TYPE ID SEMI
                          | TYPE ID ASSIGN expression SEMI"""
     if len(p) == 4:
-        p[0] = VarDecl(type_name=p[1], identifier=p[2], initializer=None, line=p.slice[1].line)
+        p[0] = VarDecl(type_name=p[1], identifier=p[2], initializer=None, line=_ln(p))
     else:
-        p[0] = VarDecl(type_name=p[1], identifier=p[2], initializer=p[4], line=p.slice[1].line)
+        p[0] = VarDecl(type_name=p[1], identifier=p[2], initializer=p[4], line=_ln(p))
 
 # Add proper array declaration support
 def p_declaration_stmt_array(p):
     """declaration_stmt : TYPE ID LBRACKET NUMBER RBRACKET SEMI"""
-    line_num = getattr(p.lexer, "lineno", 0)
     # Create a VarDecl with special array type notation
-    p[0] = VarDecl(type_name=f"{p[1]}[]", identifier=p[2], initializer=None, line=line_num)
+    p[0] = VarDecl(type_name=f"{p[1]}[]", identifier=p[2], initializer=None, line=_ln(p))
 
 # Expression statement
 def p_expression_stmt(p):
@@ -330,16 +366,15 @@ def p_expression(p):
 
 def p_assignment(p):
     """assignment : ID ASSIGN expression"""
-    p[0] = Assignment(identifier=p[1], value=p[3], line=p.slice[1].line)
+    tok = p.slice[1]
+    p[0] = Assignment(target=Identifier(name=_intern(tok.value), line=tok.line), value=p[3], line=tok.line)
 
 # Add array element assignment support
 def p_assignment_array_element(p):
     """assignment : ID LBRACKET expression RBRACKET ASSIGN expression"""
-    line_num = getattr(p.lexer, "lineno", 0)
-    # Create an array access identifier first
-    array_access = ArrayAccess(array=Identifier(name=p[1], line=line_num), index=p[3], line=line_num)
-    # Then create an assignment to this array element
-    p[0] = Assignment(identifier=f"{p[1]}[{p[3]}]", value=p[6], line=line_num)
+    line_num = _ln(p)
+    target = ArrayAccess(array=Identifier(name=_intern(p[1]), line=line_num), index=p[3], line=line_num)
+    p[0] = Assignment(target=target, value=p[6], line=line_num)
 
 # Binary arithmetic
 def p_binary_expr(p):
@@ -355,15 +390,41 @@ def p_binary_expr(p):
                    | binary_expr GE binary_expr
                    | binary_expr EQ binary_expr
                    | binary_expr NE binary_expr"""
-    p[0] = BinOp(op=p[2], left=p[1], right=p[3], line=p.slice[2].line)
+    sl = p.slice
+    op_tok = sl[2]
+    left, right = sl[1].value, sl[3].value
+    if (type(left) is ConstLiteral and type(right) is ConstLiteral
+            and type(left.value) is int and type(right.value) is int
+            and op_tok.value in ARITH_OPS):
+        folded = fold_binop(op_tok.value, left.value, right.value)
+        if folded is not None:
+            sl[0].value = ConstLiteral(op_tok.line, folded)
+            return
+    sl[0].value = BinOp(op=_intern(op_tok.value), left=left,
+                        right=right, line=op_tok.line)
 
 def p_binary_expr_uminus(p):
     """binary_expr : MINUS binary_expr %prec UMINUS"""
-    p[0] = UnaryOp(op='-', operand=p[2], line=p.slice[1].line)
+    operand = p[2]
+    if type(operand) is ConstLiteral and type(operand.value) is int:
+        negated = fold_unaryop('-', operand.value)
+        if negated is not None:
+            p[0] = ConstLiteral(_ln(p), negated)
+            return
+    p[0] = UnaryOp(op='-', operand=operand, line=_ln(p))
 
 def p_binary_expr_machi(p):
-    """binary_expr : MACHI binary_expr"""
-    p[0] = UnaryOp(op='!', operand=p[2], line=p.slice[1].line)
+    """binary_expr : MACHI binary_expr %prec MACHI"""
+    p[0] = UnaryOp(op='!', operand=p[2], line=_ln(p))
+
+# Node builders for single-token factors, called as build(line, value)
+_FACTOR_BUILDERS = {
+    "NUMBER": ConstLiteral,
+    "STRING": ConstLiteral,
+    "BOOL": ConstLiteral,
+    "NULL": ConstLiteral,
+    "ID": lambda line, name: Identifier(line, _intern(name)),
+}
 
 # Fix the binary_expr_factor function to properly handle literals and function calls
 def p_binary_expr_factor(p):
@@ -374,41 +435,36 @@ def p_binary_expr_factor(p):
                    | NULL
                    | ID
                    | func_call"""
-    if len(p) == 2:
-        tok = p.slice[1]
-        if tok.type == "NUMBER":
-            p[0] = ConstLiteral(value=p[1], line=tok.line)
-        elif tok.type == "STRING":
-            p[0] = ConstLiteral(value=p[1], line=tok.line)
-        elif tok.type == "BOOL":
-            p[0] = ConstLiteral(value=p[1], line=tok.line)
-        elif tok.type == "NULL":
-            p[0] = ConstLiteral(value=p[1], line=tok.line)
-        elif tok.type == "ID":
-            p[0] = Identifier(name=p[1], line=tok.line)
+    sl = p.slice
+    if len(sl) == 2:
+        tok = sl[1]
+        build = _FACTOR_BUILDERS.get(tok.type)
+        if build is not None:
+            sl[0].value = build(tok.line, tok.value)
         else:  # func_call already built
-            p[0] = p[1]
+            sl[0].value = tok.value
     else:
-        p[0] = p[2]  # For parenthesized expressions
+        sl[0].value = sl[2].value  # For parenthesized expressions
 
-# If / else
+# If / else – the dangling-else shift/reduce conflict is left to PLY's
+# default shift, which binds AWLA to the nearest ILA.
 def p_if_stmt(p):
     """if_stmt : ILA LPAREN expression RPAREN statement AWLA statement
-               | ILA LPAREN expression RPAREN statement %prec ILA_IFX"""
+               | ILA LPAREN expression RPAREN statement"""
     if len(p) == 8: # ILA ... AWLA ...
-        p[0] = IfStmt(test=p[3], consequent=p[5], alternate=p[7], line=p.slice[1].line)
+        p[0] = IfStmt(test=p[3], consequent=p[5], alternate=p[7], line=_ln(p))
     else: # ILA ... (no AWLA)
-        p[0] = IfStmt(test=p[3], consequent=p[5], alternate=None, line=p.slice[1].line)
+        p[0] = IfStmt(test=p[3], consequent=p[5], alternate=None, line=_ln(p))
 
 # While
 def p_while_stmt(p):
     """while_stmt : MNINTCHOUF LPAREN expression RPAREN statement"""
-    p[0] = WhileStmt(test=p[3], body=p[5], line=p.slice[1].line)
+    p[0] = WhileStmt(test=p[3], body=p[5], line=_ln(p))
 
 # For
 def p_for_stmt(p):
     """for_stmt : KOULLA LPAREN expression SEMI expression SEMI expression RPAREN statement"""
-    p[0] = ForStmt(init=p[3], test=p[5], update=p[7], body=p[9], line=p.slice[1].line)
+    p[0] = ForStmt(init=p[3], test=p[5], update=p[7], body=p[9], line=_ln(p))
 
 # Make the opt_expr rule more robust
 def p_opt_expr(p):
@@ -419,33 +475,31 @@ def p_opt_expr(p):
 # Break / Continue / Return
 def p_break_stmt(p):
     """break_stmt : HRASS SEMI"""
-    p[0] = BreakStmt(line=p.slice[1].line)
+    p[0] = BreakStmt(line=_ln(p))
 
 def p_continue_stmt(p):
     """continue_stmt : KML SEMI"""
-    p[0] = ContinueStmt(line=p.slice[1].line)
+    p[0] = ContinueStmt(line=_ln(p))
 
 def p_return_stmt(p):
     """return_stmt : RJ3 opt_expr SEMI"""
-    p[0] = ReturnStmt(value=p[2], line=p.slice[1].line)
+    p[0] = ReturnStmt(value=p[2], line=_ln(p))
 
 # Array/List related rules
 def p_binary_expr_array(p):
     """binary_expr : LBRACKET arg_list RBRACKET"""
-    p[0] = ArrayExpr(elements=p[2], line=p.slice[1].line)
+    p[0] = ArrayExpr(elements=p[2], line=_ln(p))
 
-# Fix the array access expression to handle line information correctly
+# Array access takes the line of its '['
 def p_binary_expr_array_access(p):
     """binary_expr : binary_expr LBRACKET expression RBRACKET"""
-    # Use p.lineno instead of p.slice[1].line if available, otherwise default to 0
-    line_num = getattr(p.lexer, "lineno", 0)
-    p[0] = ArrayAccess(array=p[1], index=p[3], line=line_num)
+    p[0] = ArrayAccess(array=p[1], index=p[3], line=_ln(p, 2))
 
 # Dictionary related rules
 def p_binary_expr_dict(p):
     """binary_expr : LBRACE dict_items RBRACE"""
     keys, values = p[2] if p[2] else ([], [])
-    p[0] = DictExpr(keys=keys, values=values, line=p.slice[1].line)
+    p[0] = DictExpr(keys=keys, values=values, line=_ln(p))
 
 def p_dict_items(p):
     """dict_items : dict_item_list
@@ -457,14 +511,15 @@ def p_dict_items(p):
 
 def p_dict_item_list(p):
     """dict_item_list : dict_item
-                      | dict_item COMMA dict_item_list"""
+                      | dict_item_list COMMA dict_item"""
     if len(p) == 2:
         key, value = p[1]
         p[0] = ([key], [value])
     else:
-        key, value = p[1]
-        keys, values = p[3]
-        p[0] = ([key] + keys, [value] + values)
+        p[0] = p[1]
+        key, value = p[3]
+        p[0][0].append(key)
+        p[0][1].append(value)
 
 def p_dict_item(p):
     """dict_item : expression COLON expression"""
@@ -473,7 +528,7 @@ def p_dict_item(p):
 # Class related rules
 def p_class_def(p):
     """class_def : CLASS ID class_inheritance LBRACE class_body RBRACE"""
-    p[0] = ClassDef(name=p[2], parent=p[3], body=p[5], line=p.slice[1].line)
+    p[0] = ClassDef(name=p[2], parent=p[3], body=p[5], line=_ln(p))
 
 def p_class_inheritance(p):
     """class_inheritance : EXTENDS ID
@@ -484,10 +539,11 @@ def p_class_inheritance(p):
         p[0] = None
 
 def p_class_body(p):
-    """class_body : class_member class_body
+    """class_body : class_body class_member
                   | empty"""
     if len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[0] = p[1]
+        p[0].append(p[2])
     else:
         p[0] = []
 
@@ -500,13 +556,13 @@ def p_property_decl(p):
     """property_decl : access_modifier TYPE ID SEMI
                      | access_modifier TYPE ID ASSIGN expression SEMI"""
     if len(p) == 5:
-        p[0] = Property(type_name=p[2], name=p[3], access=p[1], initializer=None, line=p.slice[2].line)
+        p[0] = Property(type_name=p[2], name=p[3], access=p[1], initializer=None, line=_ln(p, 2))
     else:
-        p[0] = Property(type_name=p[2], name=p[3], access=p[1], initializer=p[5], line=p.slice[2].line)
+        p[0] = Property(type_name=p[2], name=p[3], access=p[1], initializer=p[5], line=_ln(p, 2))
 
 def p_method_decl(p):
     """method_decl : access_modifier TYPE ID LPAREN param_list RPAREN compound"""
-    p[0] = Method(return_type=p[2], name=p[3], params=p[5], body=p[7], access=p[1], line=p.slice[2].line)
+    p[0] = Method(return_type=p[2], name=p[3], params=p[5], body=p[7], access=p[1], line=_ln(p, 2))
 
 def p_access_modifier(p):
     """access_modifier : PUBLIC
@@ -521,34 +577,35 @@ def p_access_modifier(p):
 
 def p_binary_expr_member_access(p):
     """binary_expr : binary_expr DOT ID"""
-    p[0] = MemberAccess(object=p[1], member=p[3], line=p.slice[2].line)
+    p[0] = MemberAccess(object=p[1], member=_intern(p[3]), line=_ln(p, 2))
 
 def p_binary_expr_method_call(p):
     """binary_expr : binary_expr DOT ID LPAREN arg_list RPAREN"""
-    p[0] = MethodCall(object=p[1], method=p[3], args=p[5], line=p.slice[2].line)
+    p[0] = MethodCall(object=p[1], method=_intern(p[3]), args=p[5], line=_ln(p, 2))
 
 # Try-catch statement
 def p_try_stmt(p):
     """try_stmt : TRY compound catch_clauses"""
-    p[0] = TryStmt(body=p[2], handlers=p[3], line=p.slice[1].line)
+    p[0] = TryStmt(body=p[2], handlers=p[3], line=_ln(p))
 
 def p_catch_clauses(p):
-    """catch_clauses : catch_clause catch_clauses
+    """catch_clauses : catch_clauses catch_clause
                      | catch_clause"""
     if len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[0] = p[1]
+        p[0].append(p[2])
     else:
         p[0] = [p[1]]
 
 # Update catch clause to fix syntax:
 def p_catch_clause(p):
     """catch_clause : CATCH LPAREN EXCEPTION ID RPAREN compound"""
-    p[0] = CatchClause(param_type='exception', param_name=p[4], body=p[6], line=p.slice[1].line)
+    p[0] = CatchClause(param_type='exception', param_name=p[4], body=p[6], line=_ln(p))
 
 # Throw statement
 def p_throw_stmt(p):
     """throw_stmt : THROW expression SEMI"""
-    p[0] = ThrowStmt(expression=p[2], line=p.slice[1].line)
+    p[0] = ThrowStmt(expression=p[2], line=_ln(p))
 
 # Empty production
 def p_empty(p):
@@ -560,36 +617,78 @@ def p_error(p):
     if p:
         print(f"Syntax error at '{p.value}' (line {p.line}, type {p.type})")
         
-        # Try to provide more context about the error
-        expected = []
-        
-        # Check what state we're in
-        state = parser.statestack[-1] if hasattr(parser, 'statestack') and parser.statestack else None
-        if state is not None:
-            # Get the valid tokens that could appear next
-            try:
-                for token_idx in parser.action[state].keys():
-                    if isinstance(token_idx, int) and token_idx > 0:
-                        token_name = parser.symtab[token_idx]
-                        if token_name not in expected:
-                            expected.append(token_name)
-            except (KeyError, AttributeError, TypeError) as e:
-                print(f"Error while getting expected tokens: {e}")
-            
-            if expected:
-                print(f"Expected one of: {', '.join(expected)}")
+        # Tokens the parser could have shifted or reduced on instead
+        expected = _EXPECTED.get(parser.statestack[-1]) if parser.statestack else None
+        if expected:
+            print(f"Expected one of: {', '.join(expected)}")
     else:
-        print("Syntax error at EOF")
+        stream = _active_lexer.token_stream if _active_lexer is not None else None
+        if stream is not None and len(stream):
+            # Report the line of the last token the input ended on
+            print(f"Syntax error at EOF (line {stream.lines[-1]})")
+        else:
+            print("Syntax error at EOF")
 
 # ──────────────────────────────────────────────────────────────────────
 # 5.  Build parser entry‑point
 # ──────────────────────────────────────────────────────────────────────
 
-parser = yacc.yacc(start="program", debug=True)
+def _pickle_file() -> str:
+    """Path of the pickled LALR tables in the cache directory.
+
+    The name carries this module's mtime and size, so an edited grammar gets
+    a fresh file instead of rewriting the one another checkout still uses;
+    PLY additionally checks the grammar signature stored in the pickle and
+    rebuilds the tables on a mismatch. Falls back to this module's
+    directory when the cache cannot be created.
+    """
+    here = os.path.abspath(__file__)
+    st = os.stat(here)
+    name = f"parser_tables-{st.st_mtime_ns}-{st.st_size}.pickle"
+    try:
+        os.makedirs(cache_dir(), exist_ok=True)
+        return os.path.join(cache_dir(), name)
+    except OSError:
+        return os.path.join(os.path.dirname(here), name)
+
+# DARIJA_PARSER_DEBUG=1 writes parser.out and reports grammar conflicts when
+# the tables are rebuilt; otherwise table generation is silent.
+_DEBUG = os.environ.get("DARIJA_PARSER_DEBUG") == "1"
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the parser once per process; every parse() reuses it."""
+    picklefile = _pickle_file()
+    if _DEBUG:
+        return yacc.yacc(start="program", debug=True, picklefile=picklefile)
+    return yacc.yacc(start="program", debug=False, picklefile=picklefile,
+                     errorlog=yacc.NullLogger())
+
+parser = _build_parser()
+
+# Expected-token names for every LR state, worked out once from the action
+# table so p_error reports them with a single dict lookup.
+_EXPECTED = {
+    state: tuple(sorted(tok for tok in actions if tok in _TOKEN_SET))
+    for state, actions in parser.action.items()
+}
+
+# Lexer of the parse in progress, for p_error (PLY passes it no lexer at EOF)
+_active_lexer = None
 
 def parse(src: str) -> Program:
-    lexmod.lexer.lineno = 1
-    return parser.parse(src, lexer=lexmod.lexer)
+    global _active_lexer
+    # Each call lexes with its own wrapper, so position state (lineno, token
+    # stream) never leaks from one parse into the next
+    lexer = _active_lexer = lexmod.lexer.clone()
+    return _build_parser().parse(src, lexer=lexer)
+
+def parse_lexed(lexer: lexmod.LexerWrapper) -> Program:
+    """Parse the tokens already loaded into *lexer* by ``lexer.input()``,
+    without lexing the source again."""
+    global _active_lexer
+    _active_lexer = lexer
+    return _build_parser().parse(lexer=lexer)
 
 # ──────────────────────────────────────────────────────────────────────
 # 6.  CLI for quick testing
@@ -4,8 +4,8 @@ Debug tool for DarijaLang parser
 """
 
 import sys
-from darija_parser import parse
-from darija_lexer import tokenize
+from darija_parser import parse_lexed
+import darija_lexer as lexmod
 
 def debug_parse(filename):
     """Debug the parser by showing tokens and AST"""
@@ -13,13 +13,18 @@ def debug_parse(filename):
         with open(filename, 'r') as f:
             source = f.read()
         
+        # Lex once: the tokens printed here are the ones the parser reads
+        lexer = lexmod.lexer.clone()
+        lexer.input(source)
+        stream = lexer.token_stream
         print("\n=== TOKENS ===")
-        for token in tokenize(source):
+        for pos in range(len(stream)):
+            token = stream.token(pos)
             print(f"{token.line}:{token.column} - {token.type}: {token.value!r}")
         
         print("\n=== PARSING ===")
         try:
-            ast = parse(source)
+            ast = parse_lexed(lexer)
             print("Parsing successful!")
             print("\n=== AST ===")
             print(ast)
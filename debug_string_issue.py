@@ -6,7 +6,7 @@ Debug script for string handling issues
 import os
 import sys
 from darija_parser import parse
-from darija_ir import generate_ir
+from darija_ir import generate_ir, ARG_KIND_NAMES
 from darija_c_emitter import CEmitter
 
 def debug_string_handling(source_code):
@@ -18,10 +18,14 @@ def debug_string_handling(source_code):
     
     print("\n==== IR for Function Body ====")
     if ir.functions:
+        # Collect the listing and write it in one go rather than per line
+        lines = []
         for i, instr in enumerate(ir.functions[0].body):
-            print(f"[{i}] {type(instr).__name__}: {instr}")
-            if hasattr(instr, 'args'):
-                print(f"    Args: {instr.args} (types: {[type(arg) for arg in instr.args]})")
+            lines.append(f"[{i}] {type(instr).__name__}: {instr}")
+            if hasattr(instr, 'arg_kinds'):
+                kinds = [ARG_KIND_NAMES[k] for k in instr.arg_kinds]
+                lines.append(f"    Args: {instr.args} (kinds: {kinds})")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     print("\n==== Generating C Code ====")
     emitter = CEmitter()
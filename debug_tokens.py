@@ -10,12 +10,15 @@ def main():
         return
         
     try:
-        with open(sys.argv[1], 'r') as f:
-            source = f.read()
+        with open(sys.argv[1], 'r', encoding='utf-8') as f:
+            tokens = tokenize(f.read())
             
+        # Tokens are generated lazily: flush each line so they show up as
+        # they are scanned even when stdout is a pipe
+        sys.stdout.reconfigure(line_buffering=True)
         print("Tokens from", sys.argv[1])
         print("=" * 40)
-        for token in tokenize(source):
+        for token in tokens:
             print(f"Line {token.line}: {token.type} = {token.value!r}")
     except Exception as e:
         print(f"Error: {e}")
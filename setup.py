@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""setup.py - optional compiled build of the DarijaLang compiler
+
+The compiler runs as plain Python. With Cython and a C compiler available,
+
+    python setup.py build_ext --inplace
+
+compiles the hot modules into extension modules next to their .py sources;
+Python imports the extension in preference to the .py file. Delete the
+generated .so/.pyd files (or rebuild) after editing the Python sources.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="darijalang",
+    ext_modules=cythonize(
+        ["darija_lexer.py", "darija_fold.py", "darija_ir.py", "darija_c_emitter.py"],
+        language_level=3,
+        build_dir="build",
+    ),
+)
@@ -5,9 +5,7 @@ Test script for recursive function handling
 
 import sys
 import os
-from darija_parser import parse
-from darija_ir import generate_ir
-from darija_c_emitter import CEmitter
+from _pipeline_cache import compile_cached
 
 def test_recursive_function():
     # Simple test with a recursive function
@@ -26,13 +24,8 @@ def test_recursive_function():
     }
     '''
     
-    # Parse and generate IR
-    ast = parse(test_code)
-    ir = generate_ir(ast)
-    
-    # Generate C code and print it
-    emitter = CEmitter()
-    c_code = emitter.emit(ir)
+    # Parse, generate IR and emit C (cached across runs)
+    c_code = compile_cached(test_code)
     
     print("\n=== Generated C Code ===")
     print(c_code)
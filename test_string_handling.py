@@ -9,9 +9,7 @@ import os
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from darija_parser import parse
-from darija_ir import generate_ir
-from darija_c_emitter import CEmitter
+from _pipeline_cache import compile_cached
 
 def test_string_handling():
     # Very simple test program with string
@@ -22,13 +20,8 @@ def test_string_handling():
     }
     '''
     
-    # Parse and generate IR
-    ast = parse(test_code)
-    ir = generate_ir(ast)
-    
-    # Generate C code
-    emitter = CEmitter()
-    c_code = emitter.emit(ir)
+    # Parse, generate IR and emit C (cached across runs)
+    c_code = compile_cached(test_code)
     
     print("Generated C code:")
     print("=" * 40)
@@ -7,3 +7,35 @@ import os
 # os.path.abspath ensures it's an absolute path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
+
+import pytest
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Import the whole pipeline once, before the first test runs."""
+    import darija_lexer, darija_parser, darija_ir, darija_c_emitter  # noqa: F401
+
+# Sources shared by the lexer and parser tests
+LOGICAL_CODE = """
+faragh check() {
+    bool a = bssa7;
+    bool b = machibssa7;
+    ila (a && !b || 1 == 0) {
+        hrass;
+    }
+}
+"""
+
+LEXER_SAMPLE = 'bool a = bssa7 && !machibssa7 || faragh;'
+
+@pytest.fixture(scope="session")
+def parsed_logical_ast():
+    """LOGICAL_CODE parsed once for the whole session (read-only)."""
+    from darija_parser import parse
+    return parse(LOGICAL_CODE)
+
+@pytest.fixture(scope="session")
+def tokenized_sample():
+    """LEXER_SAMPLE tokenized once for the whole session (read-only)."""
+    from darija_lexer import tokenize
+    return list(tokenize(LEXER_SAMPLE))
@@ -0,0 +1,35 @@
+# tests/test_c_emitter.py
+import os
+import subprocess
+from darija_parser import parse
+from darija_ir import generate_ir
+from darija_c_emitter import CEmitter, compile_and_run, compile_batch
+
+def test_compile_batch_reports_failures_per_program(tmp_path):
+    paths = compile_batch([
+        "int bda() { rj3 0; }",
+        "int bda() { int x = ; rj3 0; }",  # syntax error: no program to link
+    ], str(tmp_path))
+
+    assert len(paths) == 2
+    assert paths[0] == os.path.join(str(tmp_path), "prog0.out")
+    assert os.access(paths[0], os.X_OK)
+    assert paths[1] is None
+
+def test_string_escapes_reach_the_program(tmp_path):
+    [exe_path] = compile_batch(['int bda() { tba3_str("tab\\there\\\\"); rj3 0; }'], str(tmp_path))
+    result = subprocess.run([exe_path], capture_output=True, text=True)
+    assert result.stdout.startswith("tab\there\\")
+
+def test_compile_and_run_with_bare_output_name(tmp_path, monkeypatch):
+    # A bare name is relative to the working directory, not a PATH lookup
+    monkeypatch.chdir(tmp_path)
+    assert compile_and_run("int bda() { rj3 3; }", output_path="myprog") == 3
+    assert os.path.exists(tmp_path / "myprog")
+
+def test_negating_a_negative_constant_compiles(tmp_path):
+    # -(-2147483648) overflows int, so it is left unfolded for the C code
+    source = "int bda() { int d = -(-2147483648); rj3 0; }"
+    assert "-(-2147483648);" in CEmitter().emit(generate_ir(parse(source)))
+    [exe_path] = compile_batch([source], str(tmp_path))
+    assert exe_path is not None
@@ -0,0 +1,30 @@
+# tests/test_error_handling.py
+import os
+import subprocess
+import pytest
+import darija_c_emitter
+
+CODE_TEST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'code_test')
+
+# Sample program -> expected exit code
+CASES = {
+    "simple_error_test.darija": 1,    # uncaught exception exits with 1
+    "error_handling_test.darija": 0,  # every exception is caught
+}
+
+@pytest.fixture(scope="module")
+def executables(tmp_path_factory):
+    """Every sample compiled once, through a single compile_batch call."""
+    sources = []
+    for filename in CASES:
+        with open(os.path.join(CODE_TEST_DIR, filename), 'r', encoding='utf-8') as f:
+            sources.append(f.read())
+    paths = darija_c_emitter.compile_batch(sources, str(tmp_path_factory.mktemp("error_handling")))
+    return dict(zip(CASES, paths))
+
+@pytest.mark.parametrize("filename,expected", CASES.items())
+def test_error_files(executables, filename, expected):
+    exe_path = executables[filename]
+    assert exe_path is not None, f"{filename} did not compile"
+    result = subprocess.run([exe_path], capture_output=True)
+    assert result.returncode == expected
@@ -0,0 +1,120 @@
+# tests/test_ir.py
+from darija_parser import parse
+from darija_ir import generate_ir, IRBinOp, IRStore, IRLabel, IRGoto, IRCondJumpIfFalse, IRCall, IRStringRef
+from darija_ir import ARG_CONST, ARG_NAME, ARG_STRING_REF
+from darija_c_emitter import CEmitter
+code = """
+int bda() {
+    int a = -7 / 2;
+    int b = (0.3 + 0.3) + 2;
+    int c = 1 < 2 && !0;
+    int d = a * 2;
+    int e = 4 / 0;
+    rj3 0;
+}
+"""
+
+def test_constant_folding():
+    body = generate_ir(parse(code)).functions[0].body
+    stores = {i.target_var: i.source_var_or_const for i in body if isinstance(i, IRStore)}
+
+    # Constant operands fold with C semantics (int temps, truncating division)
+    assert stores['a'] == -3
+    assert stores['b'] == 2
+    assert stores['c'] == 1
+
+    # Anything involving a variable or a division by zero is left to C
+    binops = [i for i in body if isinstance(i, IRBinOp)]
+    assert [(i.op, i.left_operand, i.right_operand) for i in binops] == [('*', 'a', 2), ('/', 4, 0)]
+
+def test_peephole_merges_labels():
+    body = generate_ir(parse("""
+int bda() {
+    int x = 1;
+    ila (x == 1) { x = 2; } awla { ila (x == 2) { x = 3; } awla { x = 4; } }
+    rj3 x;
+}
+""")).functions[0].body
+    labels = [i.name for i in body if isinstance(i, IRLabel)]
+    jumps = {i.label for i in body if isinstance(i, IRGoto)}
+    jumps |= {i.false_label for i in body if isinstance(i, IRCondJumpIfFalse)}
+
+    # The nested if/else ends in a single label; every label is a jump target
+    assert set(labels) == jumps
+    assert not any(isinstance(a, IRLabel) and isinstance(b, IRLabel) for a, b in zip(body, body[1:]))
+
+def test_common_subexpressions():
+    body = generate_ir(parse("""
+int bda() {
+    int a = 3;
+    int x = a * 2 + a * 2;
+    a = a + 1;
+    int y = a * 2;
+    rj3 y;
+}
+""")).functions[0].body
+    muls = [i for i in body if isinstance(i, IRBinOp) and i.op == '*']
+
+    # a * 2 is computed once for x, then again after a is reassigned
+    assert len(muls) == 2
+    add = next(i for i in body if isinstance(i, IRBinOp) and i.op == '+' and i.left_operand != 'a')
+    assert add.left_operand == add.right_operand == muls[0].target_temp_var
+
+def test_assignments_write_operations_directly():
+    body = generate_ir(parse("""
+int bda() {
+    int a = 3;
+    int y = a * 2;
+    int z = a * 2;
+    a = a + 1;
+    rj3 a;
+}
+""")).functions[0].body
+    ops = [(i.target_temp_var, i.op) for i in body if isinstance(i, IRBinOp)]
+    stores = [(i.target_var, i.source_var_or_const) for i in body if isinstance(i, IRStore)]
+
+    # No temps in between: y and a are computed in place, z copies y
+    assert ops == [('y', '*'), ('a', '+')]
+    assert stores == [('a', 3), ('z', 'y')]
+
+def test_string_literals_are_pooled():
+    program = generate_ir(parse("""
+int bda() {
+    tba3_str("hello");
+    tba3_str("say \\"hi\\"");
+    tba3_str("hello");
+    rj3 0;
+}
+"""))
+    calls = [i for i in program.functions[0].body if isinstance(i, IRCall)]
+
+    # Each distinct literal is pooled once; "hello" is not taken for a variable
+    assert program.string_pool == ['hello', 'say "hi"']
+    assert [c.args for c in calls] == [[IRStringRef(0)], [IRStringRef(1)], [IRStringRef(0)]]
+    c_code = CEmitter().emit(program)
+    assert 'static const char __darija_str1[] = "say \\"hi\\"";' in c_code
+    assert "int hello;" not in c_code
+
+def test_pure_int_recursion_is_memoized():
+    functions = {f.name: f for f in generate_ir(parse("""
+int fib(int n) {
+    ila (n < 2) { rj3 n; }
+    rj3 fib(n - 1) + fib(n - 2);
+}
+int countdown(int n) {
+    tba3(n);
+    ila (0 < n) { rj3 countdown(n - 1); }
+    rj3 0;
+}
+int bda() { rj3 fib(10); }
+""")).functions}
+
+    # Only fib depends on its argument alone; countdown prints
+    assert functions['fib'].memoize
+    assert not functions['countdown'].memoize
+    assert not functions['bda'].memoize
+
+def test_call_args_are_tagged_by_kind():
+    call = IRCall("f", [3, "x", IRStringRef(0), 1.5])
+    assert call.arg_kinds == bytes([ARG_CONST, ARG_NAME, ARG_STRING_REF, ARG_CONST])
+    assert IRCall("g", []).arg_kinds == b""
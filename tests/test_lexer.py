@@ -1,10 +1,8 @@
 # tests/test_lexer.py
 from darija_lexer import tokenize, Token
 
-sample = 'bool a = bssa7 && !machibssa7 || faragh;'
-
-def test_logical_tokens():
-    tokens = list(tokenize(sample))
+def test_logical_tokens(tokenized_sample):
+    tokens = tokenized_sample
     values = [t.value for t in tokens]
 
     # Quick sanity: the operator symbols must be present
@@ -18,3 +16,8 @@ def test_logical_tokens():
         '!', False, '||', 'faragh', ';'
     ]
     assert values == expected
+
+def test_digit_led_words():
+    # 7awl / 3ajib / 9ism are keywords; any other digit-led word is a number then a name
+    types = [t.type for t in tokenize('7awl 3ajib 9ism 3x 12.5')]
+    assert types == ['TRY', 'EXCEPTION', 'CLASS', 'NUMBER', 'ID', 'NUMBER']
@@ -1,18 +1,9 @@
 # tests/test_parser.py
 from darija_parser import parse
-from darija_parser import BinOp, UnaryOp, Identifier, ConstLiteral
-code = """
-faragh check() {
-    bool a = bssa7;
-    bool b = machibssa7;
-    ila (a && !b || 1 == 0) {
-        hrass;
-    }
-}
-"""
-
-def test_logical_ast_shape():
-    ast = parse(code)        # returns Program(AST)
+from darija_parser import Program, BinOp, UnaryOp, Identifier, ConstLiteral
+
+def test_logical_ast_shape(parsed_logical_ast):
+    ast = parsed_logical_ast        # Program(AST), parsed once per session
 
     # Program->FuncDef->Body->If
     func_def_node = ast.body[0]      # Program.body contains top-level nodes
@@ -33,6 +24,35 @@ def test_logical_ast_shape():
     right = if_stmt.test.right
     assert isinstance(right, BinOp) and right.op == '=='
 
-def test_parser_no_syntax_error():
-    # The same code should round-trip without throwing
-    parse(code)
+def test_parser_no_syntax_error(parsed_logical_ast):
+    # The same code should parse without a syntax error
+    assert isinstance(parsed_logical_ast, Program)
+
+
+def test_dangling_else_binds_to_nearest_if():
+    ast = parse("int bda() { ila (1) ila (0) kteb(1); awla kteb(2); rj3 0; }")
+    outer = ast.body[0].body.statements[0]
+    assert outer.alternate is None
+    assert outer.consequent.alternate is not None
+
+
+def test_array_element_assignment_keeps_target_node():
+    from darija_parser import ArrayAccess
+    ast = parse("int bda() { xs[2] = 5; rj3 0; }")
+    assign = ast.body[0].body.statements[0]
+    assert isinstance(assign.target, ArrayAccess)
+    assert assign.target.array.name == "xs"
+    assert assign.target.index.value == 2
+
+
+def test_array_nodes_carry_their_own_line():
+    ast = parse("int bda() {\n  int xs[3];\n  xs[1] = 2;\n  rj3 0;\n}")
+    decl, assign = ast.body[0].body.statements[:2]
+    assert decl.line == 2
+    assert assign.line == 3 and assign.target.line == 3
+
+
+def test_integer_arithmetic_on_literals_is_folded():
+    ast = parse("int bda() { rj3 -7 / 2 + 3 * 4; }")
+    value = ast.body[0].body.statements[0].value
+    assert isinstance(value, ConstLiteral) and value.value == 9  # C division truncates